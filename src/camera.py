@@ -0,0 +1,119 @@
+import numpy as np
+
+class Camera:
+    """
+    Estado versionado da câmera (COP, VPN, VUP, VRP, distância focal, limites da window
+    e tipo de projeção).
+
+    Toda atribuição que realmente altera um campo incrementa `version`, que serve de
+    chave para caches derivados da câmera (matrizes de view/projeção, coordenadas
+    normalizadas dos objetos, etc.).
+    """
+
+    def __init__(self, cop, vpn, vup, vrp, focal_distance, window_bounds, projection, matrix_builder=None):
+        self._version = 0
+
+        self._cop = self._frozen_vector(cop)
+        self._vpn = self._frozen_vector(vpn)
+        self._vup = self._frozen_vector(vup)
+        self._vrp = self._frozen_vector(vrp)
+        self._focal_distance = float(focal_distance)
+        self._window_bounds = self._frozen_bounds(window_bounds)
+        self._projection = projection
+
+        # função (camera) -> (view_matrix, projection_matrix), chamada só quando a versão muda
+        self._matrix_builder = matrix_builder
+        self._matrices = None
+        self._matrices_version = None
+
+    @property
+    def version(self):
+        return self._version
+
+    @staticmethod
+    def _frozen_vector(value):
+        vector = np.array(value, dtype=float)
+        vector.setflags(write=False)
+        return vector
+
+    @staticmethod
+    def _frozen_bounds(bounds):
+        return tuple(tuple(float(v) for v in corner) for corner in bounds)
+
+    def _set_vector(self, attribute, value):
+        vector = self._frozen_vector(value)
+        if not np.array_equal(getattr(self, attribute), vector):
+            setattr(self, attribute, vector)
+            self._version += 1
+
+    def _set_value(self, attribute, value):
+        if getattr(self, attribute) != value:
+            setattr(self, attribute, value)
+            self._version += 1
+
+    @property
+    def cop(self):
+        return self._cop
+
+    @cop.setter
+    def cop(self, value):
+        self._set_vector("_cop", value)
+
+    @property
+    def vpn(self):
+        return self._vpn
+
+    @vpn.setter
+    def vpn(self, value):
+        self._set_vector("_vpn", value)
+
+    @property
+    def vup(self):
+        return self._vup
+
+    @vup.setter
+    def vup(self, value):
+        self._set_vector("_vup", value)
+
+    @property
+    def vrp(self):
+        return self._vrp
+
+    @vrp.setter
+    def vrp(self, value):
+        self._set_vector("_vrp", value)
+
+    @property
+    def focal_distance(self):
+        return self._focal_distance
+
+    @focal_distance.setter
+    def focal_distance(self, value):
+        self._set_value("_focal_distance", float(value))
+
+    @property
+    def window_bounds(self):
+        return self._window_bounds
+
+    @window_bounds.setter
+    def window_bounds(self, value):
+        self._set_value("_window_bounds", self._frozen_bounds(value))
+
+    @property
+    def projection(self):
+        return self._projection
+
+    @projection.setter
+    def projection(self, value):
+        self._set_value("_projection", value)
+
+    def set_matrix_builder(self, matrix_builder):
+        self._matrix_builder = matrix_builder
+        self._matrices_version = None
+
+    def get_matrices(self):
+        """Retorna (view_matrix, projection_matrix), reconstruindo-as apenas se a câmera mudou."""
+        if self._matrices_version != self._version:
+            self._matrices = self._matrix_builder(self)
+            self._matrices_version = self._version
+        return self._matrices
@@ -0,0 +1,92 @@
+import tkinter as tk
+
+class CanvasItemManager:
+    """
+    Mantém um pool persistente de itens do canvas por objeto, reaproveitando-os entre frames.
+
+    Em vez de apagar tudo e recriar um item por segmento a cada redesenho, os itens
+    existentes são atualizados com coords() e escondidos/mostrados via `state`. Itens só
+    são criados ou apagados quando o número de segmentos de um objeto muda.
+    """
+
+    def __init__(self, canvas):
+        self._canvas = canvas
+        # dono -> {tipo -> {"ids": [...], "states": [...]}}
+        self._pools = {}
+        self._touched = set()
+
+    def begin_frame(self):
+        self._touched = set()
+
+    def end_frame(self):
+        # objetos que não desenharam nada neste frame (ex.: removidos da display file)
+        for owner in [owner for owner in self._pools if owner not in self._touched]:
+            self._delete_owner(owner)
+
+    def clear(self):
+        for owner in list(self._pools):
+            self._delete_owner(owner)
+        self._touched = set()
+
+    def hide(self, owner):
+        """Esconde todos os itens de um objeto sem destruí-los."""
+        self._touched.add(owner)
+        for pool in self._pools.get(owner, {}).values():
+            self._set_states(pool, [False] * len(pool["ids"]))
+
+    def _delete_owner(self, owner):
+        for pool in self._pools.pop(owner).values():
+            if pool["ids"]:
+                self._canvas.delete(*pool["ids"])
+
+    def lines(self, owner, lines, visible=None, **options):
+        """
+        Desenha uma linha por entrada de `lines` ((x0, y0, x1, y1) em coordenadas de viewport).
+
+        Args:
+            visible: sequência opcional de booleanos; segmentos invisíveis são escondidos.
+        """
+        self._draw(owner, "line", self._canvas.create_line, lines, visible, options)
+
+    def polygon(self, owner, flat_coords, **options):
+        self._draw(owner, "polygon", self._canvas.create_polygon, [flat_coords], None, options)
+
+    def oval(self, owner, bbox, **options):
+        self._draw(owner, "oval", self._canvas.create_oval, [bbox], None, options)
+
+    def rectangle(self, owner, bbox, **options):
+        self._draw(owner, "rectangle", self._canvas.create_rectangle, [bbox], None, options)
+
+    def _draw(self, owner, kind, create, coords_list, visible, options):
+        self._touched.add(owner)
+
+        pool = self._pools.setdefault(owner, {}).setdefault(kind, {"ids": [], "states": []})
+        ids, states = pool["ids"], pool["states"]
+
+        count = len(coords_list)
+        if visible is None:
+            visible = [True] * count
+
+        # ajusta o tamanho do pool apenas quando o número de segmentos muda
+        if len(ids) > count:
+            self._canvas.delete(*ids[count:])
+            del ids[count:]
+            del states[count:]
+
+        for i in range(len(ids)):
+            if visible[i]:
+                self._canvas.coords(ids[i], *coords_list[i])
+
+        for i in range(len(ids), count):
+            ids.append(create(*coords_list[i], **options))
+            states.append(True)
+
+        self._set_states(pool, visible)
+
+    def _set_states(self, pool, visible):
+        ids, states = pool["ids"], pool["states"]
+        for i in range(len(ids)):
+            shown = bool(visible[i])
+            if states[i] != shown:
+                self._canvas.itemconfigure(ids[i], state=tk.NORMAL if shown else tk.HIDDEN)
+                states[i] = shown
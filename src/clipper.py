@@ -84,7 +84,7 @@ class Clipper:
 
         if accept:
             ##print(f"Line {line.get_id()} accepted: ({x1}, {y1}) -> ({x2}, {y2})")
-            line.set_scn_vertices([(x1, y1), (x2, y2)])
+            line.set_clipped_vertices([(x1, y1), (x2, y2)])
             line.in_window = True
         else:
             ##print(f"Line {line.get_id()} rejected")
@@ -117,6 +117,7 @@ class Clipper:
         u1, u2 = 0, 1
 
         if x_min < x1 < x_max and y_min < y1 < y_max and x_min < x2 < x_max and y_min < y2 < y_max:
+            line.set_clipped_vertices(line.get_scn_vertices())
             line.in_window = True
             return
 
@@ -141,7 +142,7 @@ class Clipper:
         y2_clip = y1 + u2 * dy
         
         scn_vertices = [(x1_clip, y1_clip), (x2_clip, y2_clip)]
-        line.set_scn_vertices(scn_vertices)
+        line.set_clipped_vertices(scn_vertices)
         line.in_window = True
 ###################################################################################################
 
@@ -171,7 +172,7 @@ class Clipper:
         # Verifica se o wireframe está visível após o clipping
         if polygon_points:
             wireframe.in_window = True
-            wireframe.set_scn_vertices(polygon_points)  # Atualiza os vértices clipados
+            wireframe.set_clipped_vertices(polygon_points)  # Atualiza os vértices clipados
 
     # Function to return x-value of point of intersection of two lines
     def x_intersect(self, x1, y1, x2, y2, x3, y3, x4, y4):
@@ -231,56 +232,123 @@ class Clipper:
     
     def clip_object3d(self, object3d, window):
 
-        segments = object3d.get_normalized_segments()
-        for i in range(len(segments)):
-            ##print(object3d.in_window)
-            object3d.in_window[i] = False
-            x_min = y_min = -1 + self.margin
-            x_max = y_max = 1 - self.margin
-            x1, y1 = segments[i][0]
-            x2, y2 = segments[i][1]
-            code1 = self.compute_cohen_sutherland_code(x1, y1, x_min, x_max, y_min, y_max)
-            code2 = self.compute_cohen_sutherland_code(x2, y2, x_min, x_max, y_min, y_max)
-
-            accept = False
-            while True:
-                if code1 == 0 and code2 == 0:
-                    accept = True
-                    break
-                elif code1 & code2 != 0:
-                    break
-                else:
-                    x, y = 0, 0
-                    code_out = code1 if code1 != 0 else code2
-                    if x2 == x1:
-                        m = float('inf')
-                    else:
-                        m = (y2 - y1) / (x2 - x1)
-
-                    if code_out & 8:
-                        x = x1 + (1 / m) * (y_max - y1) if m != float('inf') else x1
-                        y = y_max
-                    elif code_out & 4:
-                        x = x1 + (1 / m) * (y_min - y1) if m != float('inf') else x1
-                        y = y_min
-                    elif code_out & 2:
-                        y = m * (x_max - x1) + y1 if m != float('inf') else y1
-                        x = x_max
-                    elif code_out & 1:
-                        y = m * (x_min - x1) + y1 if m != float('inf') else y1
-                        x = x_min
-
-                    if code_out == code1:
-                        x1, y1 = x, y
-                        code1 = self.compute_cohen_sutherland_code(x1, y1, x_min, x_max, y_min, y_max)
-                    else:
-                        x2, y2 = x, y
-                        code2 = self.compute_cohen_sutherland_code(x2, y2, x_min, x_max, y_min, y_max)
-
-            if accept:
-                #print(f"Line {i} accepted: ({x1:.3f}, {y1:.3f}) -> ({x2:.3f}, {y2:.3f})")
-                segments[i] = [(x1, y1), (x2, y2)]
-                object3d.in_window[i] = True
-            else:
-                #print(f"Line {i} rejected: ({x1:.3f}, {y1:.3f}) -> ({x2:.3f}, {y2:.3f})")
-                object3d.in_window[i] = False
\ No newline at end of file
+        # as coordenadas normalizadas ficam em cache entre frames; o clipping gera um novo array
+        segments = np.asarray(object3d.get_normalized_segments(), dtype=float).reshape(-1, 2, 2)
+
+        clipped, visible = self.clip_segments(segments)
+
+        object3d.set_clipped_vertices(clipped)
+        object3d.in_window = visible
+
+    ###################################################################################################
+    # CLIPPING VETORIZADO DE SEGMENTOS
+
+    def clip_segments(self, segments):
+        """
+        Clipa um lote de segmentos normalizados de uma só vez.
+
+        Args:
+            segments: array (E, 2, 2) com as extremidades de cada segmento.
+
+        Returns:
+            Tupla (clipped, visible): array (E, 2, 2) com as extremidades clipadas e
+            máscara booleana (E,) dos segmentos que ficam (parcialmente) dentro da window.
+            Segmentos invisíveis mantêm suas coordenadas originais.
+        """
+        segments = np.asarray(segments, dtype=float).reshape(-1, 2, 2)
+
+        if self.selected_algorithm == 1:
+            return self.clip_segments_cohen_sutherland(segments)
+        return self.clip_segments_liang_barsky(segments)
+
+    def compute_cohen_sutherland_codes(self, x, y, x_min, x_max, y_min, y_max):
+        codes = np.zeros(x.shape, dtype=np.int8)
+        codes |= np.where(x < x_min, 1, np.where(x > x_max, 2, 0)).astype(np.int8)
+        codes |= np.where(y < y_min, 4, np.where(y > y_max, 8, 0)).astype(np.int8)
+        return codes
+
+    def clip_segments_cohen_sutherland(self, segments):
+        x_min = y_min = -1 + self.margin
+        x_max = y_max = 1 - self.margin
+
+        x1, y1 = segments[:, 0, 0].copy(), segments[:, 0, 1].copy()
+        x2, y2 = segments[:, 1, 0].copy(), segments[:, 1, 1].copy()
+        code1 = self.compute_cohen_sutherland_codes(x1, y1, x_min, x_max, y_min, y_max)
+        code2 = self.compute_cohen_sutherland_codes(x2, y2, x_min, x_max, y_min, y_max)
+
+        accept = np.zeros(len(segments), dtype=bool)
+        active = np.ones(len(segments), dtype=bool)
+
+        # cada iteração move uma extremidade de cada segmento ativo para uma borda;
+        # um segmento precisa de no máximo 4 iterações (duas bordas por extremidade)
+        while active.any():
+            accepted_now = active & (code1 == 0) & (code2 == 0)
+            rejected_now = active & ((code1 & code2) != 0)
+            accept |= accepted_now
+            active &= ~(accepted_now | rejected_now)
+
+            if not active.any():
+                break
+
+            idx = np.nonzero(active)[0]
+            c1, c2 = code1[idx], code2[idx]
+            first = c1 != 0
+            code_out = np.where(first, c1, c2)
+
+            ax, ay, bx, by = x1[idx], y1[idx], x2[idx], y2[idx]
+            dx, dy = bx - ax, by - ay
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                x_top = ax + dx * (y_max - ay) / dy
+                x_bottom = ax + dx * (y_min - ay) / dy
+                y_right = ay + dy * (x_max - ax) / dx
+                y_left = ay + dy * (x_min - ax) / dx
+
+            # mesma prioridade de bordas do algoritmo escalar: topo, base, direita, esquerda
+            top = (code_out & 8) != 0
+            bottom = ~top & ((code_out & 4) != 0)
+            right = ~top & ~bottom & ((code_out & 2) != 0)
+
+            x = np.where(top, x_top, np.where(bottom, x_bottom, np.where(right, x_max, x_min)))
+            y = np.where(top, y_max, np.where(bottom, y_min, np.where(right, y_right, y_left)))
+
+            new_codes = self.compute_cohen_sutherland_codes(x, y, x_min, x_max, y_min, y_max)
+
+            idx1, idx2 = idx[first], idx[~first]
+            x1[idx1], y1[idx1], code1[idx1] = x[first], y[first], new_codes[first]
+            x2[idx2], y2[idx2], code2[idx2] = x[~first], y[~first], new_codes[~first]
+
+        clipped = np.stack([np.stack([x1, y1], axis=1), np.stack([x2, y2], axis=1)], axis=1)
+        clipped[~accept] = segments[~accept]
+
+        return clipped, accept
+
+    def clip_segments_liang_barsky(self, segments):
+        x_min = y_min = -1 + self.margin
+        x_max = y_max = 1 - self.margin
+
+        x1, y1 = segments[:, 0, 0], segments[:, 0, 1]
+        x2, y2 = segments[:, 1, 0], segments[:, 1, 1]
+        dx, dy = x2 - x1, y2 - y1
+
+        # (4, E): uma linha por borda (esquerda, direita, base, topo)
+        p = np.stack([-dx, dx, -dy, dy])
+        q = np.stack([x1 - x_min, x_max - x1, y1 - y_min, y_max - y1])
+
+        parallel = p == 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r = q / np.where(parallel, 1.0, p)
+
+        u1 = np.max(np.where(~parallel & (p < 0), r, 0.0), axis=0)
+        u2 = np.min(np.where(~parallel & (p > 0), r, 1.0), axis=0)
+
+        # segmento paralelo a uma borda e do lado de fora dela é rejeitado
+        outside_parallel = np.any(parallel & (q < 0), axis=0)
+        visible = ~outside_parallel & (u1 <= u2)
+
+        start = np.stack([x1 + u1 * dx, y1 + u1 * dy], axis=1)
+        end = np.stack([x1 + u2 * dx, y1 + u2 * dy], axis=1)
+
+        clipped = np.where(visible[:, None, None], np.stack([start, end], axis=1), segments)
+
+        return clipped, visible
@@ -3,21 +3,49 @@
 DEFAULT_SELECTED_OBJECT = "Point"
 POSSIBLE_OBJECTS = ["Point", "Line", "Wireframe", "Curve", "3DObject"]
 AVAILABLE_CURVES = ["Bezier", "B-Spline"]
-AVAILABLE_SURFACES = ["BezierSurface"]
+AVAILABLE_SURFACES = ["BezierSurface", "BSplineSurface"]
 
 CURVE_TYPE_BEZIER = "Bezier"
 CURVE_TYPE_BSPLINE = "B-Spline"
 
+CURVE_TESSELLATION_FIXED = "fixed"        # passo fixo em t
+CURVE_TESSELLATION_ADAPTIVE = "adaptive"  # subdivide até a tolerância de planicidade
+CURVE_TESSELLATION = CURVE_TESSELLATION_ADAPTIVE
+CURVE_FLATNESS_TOLERANCE = 0.25           # distância máxima curva-corda, em pixels de tela
+CURVE_MAX_SUBDIVISION_DEPTH = 12
+
 WINDOW_BOUNDS = [(0, 0), (1920, 1080)]
 WINDOW_TO_VIEWPORT_RATIO = 0.95
 
 VIEW_UP_VECTOR = (0, 1, 0)
 VIEW_PLANE_NORMAL = (0, 0, 1)
 VIEW_REFERENCE_POINT = [0, 0, 0]
+CENTER_OF_PROJECTION = (0, 0, -800)
+
+DEFAULT_FOCAL_DISTANCE = 500
+SHORT_FOCAL_DISTANCE = 100
 
 PARALLEL_PROJECTION = "parallel"
 PERSPECTIVE_PROJECTION = "perspective"
 
+RENDER_BACKEND_CANVAS = "canvas"            # um item do Tk Canvas por segmento
+RENDER_BACKEND_FRAMEBUFFER = "framebuffer"  # framebuffer NumPy apresentado como um PhotoImage
+RENDER_BACKEND = RENDER_BACKEND_CANVAS
+
+OBJ_CHUNK_SIZE = 4 * 1024 * 1024  # bytes de texto .obj convertidos para arrays por vez
+OBJ_PARALLEL_IMPORT = False        # importa .obj em um pool de processos
+OBJ_IMPORT_WORKERS = None          # processos do pool; None usa o número de CPUs
+OBJ_WRITE_BUFFER_SIZE = 1024 * 1024
+OBJ_WRITE_BLOCK_ROWS = 65536       # linhas do .obj formatadas por operação
+IMPORT_POLL_INTERVAL = 50          # ms entre leituras da fila da importação em segundo plano
+
+OBJ_CACHE_ENABLED = True
+OBJ_CACHE_DIR = "~/.cache/sistema_grafico/obj"
+OBJ_CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024
+OBJ_CACHE_MAX_ENTRIES = 64
+OBJ_CACHE_COMPRESSED = False       # entradas comprimidas ocupam menos disco, mas não podem ser mapeadas
+OBJ_CACHE_MMAP_MODE = "r"          # None carrega as entradas inteiras em memória
+
 # ui constants
 
 UI_BACKGROUND_COLOR = "#848a88"
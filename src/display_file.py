@@ -1,36 +1,58 @@
 class DisplayFile:
     def __init__(self):
-        self.objects = []
+        # id -> objeto; o dict preserva a ordem de inserção, que é a ordem de desenho
+        self._objects = {}
         self._observers = []
 
     def add_object(self, obj):
 
-        self.objects.append(obj)
+        self.add_objects([obj])
+
+    def add_objects(self, objects):
+        # um lote inteiro gera uma única notificação
+        for obj in objects:
+            if obj.get_id() in self._objects:
+                raise ValueError(f"Object with id {obj.get_id()} already in the display file")
+            self._objects[obj.get_id()] = obj
+        self.notify()
 
     def remove_object(self, obj):
 
-        if obj in self.objects:
-            self.objects.remove(obj)
+        self.remove_objects([obj])
+
+    def remove_objects(self, objects):
+        removed = False
+        for obj in objects:
+            # só remove se o id pertence a este mesmo objeto
+            if self._objects.get(obj.get_id()) is obj:
+                del self._objects[obj.get_id()]
+                removed = True
+        if removed:
+            self.notify()
 
     def get_objects(self):
+        # cópia: quem itera pode adicionar ou remover objetos no meio do caminho
+        return list(self._objects.values())
 
-        return self.objects
-    
     def get_object_by_id(self, obj_id):
         if type(obj_id) == str:
             obj_id = int(obj_id)
 
-        for obj in self.objects:
-            if obj.get_id() == obj_id:
-                return obj
-        return
-    
+        return self._objects.get(obj_id)
+
+    def __len__(self):
+        return len(self._objects)
+
+    def __contains__(self, obj):
+        return self._objects.get(obj.get_id()) is obj
+
     def get_objects_infos(self):
-        return [f"{obj.get_info()}" for obj in self.objects]
+        return [f"{obj.get_info()}" for obj in self._objects.values()]
 
     def clear(self):
 
-        self.objects.clear()
+        self._objects.clear()
+        self.notify()
 
     # observer design pattern. Object_manager_ui é notificado de mudancas na lista de display de objetos e atualiza
     def subscribe(self, observer):
@@ -20,11 +20,20 @@ class FileLoader:
             ##print(f"Error loading image: {e}")
             return None
 
+    # formatos de modelo suportados; o formato é escolhido pela extensão do arquivo
+    MODEL_FILETYPES = [
+        ("3D Models", "*.obj *.stl *.ply"),
+        ("OBJ Files", "*.obj"),
+        ("Binary STL Files", "*.stl"),
+        ("Binary PLY Files", "*.ply"),
+        ("All Files", "*.*"),
+    ]
+
     @staticmethod
     def open_file_dialog():
         """Opens a file dialog to select a file."""
         return filedialog.askopenfilename(
-            filetypes=[("OBJ Files", "*.obj"), ("All Files", "*.*")]
+            filetypes=FileLoader.MODEL_FILETYPES
         )
 
     @staticmethod
@@ -32,5 +41,5 @@ class FileLoader:
         """Opens a file dialog to select a location to save the file."""
         return filedialog.asksaveasfilename(
             defaultextension=".obj",
-            filetypes=[("OBJ Files", "*.obj"), ("All Files", "*.*")]
+            filetypes=FileLoader.MODEL_FILETYPES[1:]
         )
@@ -0,0 +1,230 @@
+import tkinter as tk
+import numpy as np
+from PIL import Image, ImageColor, ImageTk
+import constants as c
+
+class Framebuffer:
+    """
+    Backend de desenho em um framebuffer RGB NumPy (altura x largura x 3).
+
+    Expõe a mesma interface do CanvasItemManager (lines, polygon, oval, rectangle,
+    hide, begin_frame/end_frame), de forma que os objetos gráficos desenham nele sem
+    nenhuma alteração. A rasterização de linhas é vetorizada sobre todos os segmentos
+    de uma chamada.
+    """
+
+    def __init__(self, width, height, background):
+        # cor -> tupla RGB já resolvida; as mesmas poucas cores se repetem a cada frame
+        self._colors = {}
+        self._background = self._rgb(background)
+        self.resize(width, height)
+
+    def resize(self, width, height):
+        self.width = int(width)
+        self.height = int(height)
+        self.pixels = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        self._fill_background()
+
+    def _fill_background(self):
+        self.pixels[:] = self._background
+
+    def begin_frame(self):
+        # o framebuffer é redesenhado do zero a cada frame
+        self._fill_background()
+
+    def end_frame(self):
+        pass
+
+    def clear(self):
+        self._fill_background()
+
+    def hide(self, owner):
+        # nada a esconder: objetos fora da window simplesmente não são rasterizados
+        pass
+
+    def to_image(self):
+        return Image.fromarray(self.pixels, "RGB")
+
+    def save(self, file_path):
+        self.to_image().save(file_path)
+
+    def _rgb(self, color):
+        """Converte um nome de cor ou "#rrggbb" para uma tupla RGB; "" significa sem cor."""
+        if not color:
+            return None
+        if color not in self._colors:
+            self._colors[color] = self._resolve_color(color)
+        return self._colors[color]
+
+    def _resolve_color(self, color):
+        # o PIL não conhece todos os nomes do Tk ("gray50", "SystemButtonFace", ...);
+        # uma cor desconhecida é desenhada com a cor padrão em vez de abortar o frame
+        try:
+            return ImageColor.getrgb(color)[:3]
+        except ValueError:
+            return ImageColor.getrgb(c.DEFAULT_OBJECT_COLOR)[:3]
+
+    def lines(self, owner, lines, visible=None, fill="black", width=1, dash=None, **options):
+        """
+        Rasteriza um lote de segmentos ((x0, y0, x1, y1) em coordenadas de viewport).
+
+        Args:
+            visible: sequência opcional de booleanos; segmentos invisíveis são ignorados.
+        """
+        color = self._rgb(fill)
+        if color is None:
+            return
+
+        lines = np.asarray(lines, dtype=float).reshape(-1, 4)
+        if visible is not None:
+            lines = lines[np.asarray(visible, dtype=bool)]
+        lines = lines[np.isfinite(lines).all(axis=1)]
+
+        xs, ys, steps = self._sample_lines(lines)
+
+        if dash:
+            # padrão (traço, espaço) medido em pixels ao longo de cada segmento
+            on, off = dash[0], dash[1] if len(dash) > 1 else dash[0]
+            keep = (steps % (on + off)) < on
+            xs, ys = xs[keep], ys[keep]
+
+        for offset in range(int(width)):
+            self._plot(xs + offset, ys, color)
+            self._plot(xs, ys + offset, color)
+
+    def _sample_lines(self, lines):
+        """
+        Amostra todos os segmentos de uma vez: um ponto por pixel ao longo do eixo dominante.
+
+        Returns:
+            Tupla (xs, ys, steps) com as coordenadas inteiras dos pixels e o índice de
+            cada amostra dentro do seu segmento.
+        """
+        if len(lines) == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, empty
+
+        x0, y0, x1, y1 = lines.T
+        dx, dy = x1 - x0, y1 - y0
+
+        # limita o número de amostras por segmento ao tamanho do framebuffer
+        length = np.minimum(np.maximum(np.abs(dx), np.abs(dy)), 2 * (self.width + self.height))
+        counts = np.ceil(length).astype(np.int64) + 1
+
+        segment = np.repeat(np.arange(len(lines)), counts)
+        starts = np.repeat(np.cumsum(counts) - counts, counts)
+        steps = np.arange(counts.sum()) - starts
+
+        t = steps / np.maximum(counts - 1, 1)[segment]
+
+        xs = np.rint(x0[segment] + t * dx[segment]).astype(np.int64)
+        ys = np.rint(y0[segment] + t * dy[segment]).astype(np.int64)
+
+        return xs, ys, steps
+
+    def _plot(self, xs, ys, color):
+        inside = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        self.pixels[ys[inside], xs[inside]] = color
+
+    def polygon(self, owner, flat_coords, fill=None, outline=None, **options):
+        points = np.asarray(flat_coords, dtype=float).reshape(-1, 2)
+        if len(points) < 2:
+            return
+
+        fill_color = self._rgb(fill)
+        if fill_color is not None and len(points) >= 3:
+            self._fill_polygon(points, fill_color)
+
+        if self._rgb(outline) is not None:
+            edges = np.hstack([points, np.roll(points, -1, axis=0)])
+            self.lines(owner, edges, fill=outline)
+
+    def _fill_polygon(self, points, color):
+        """Preenchimento por scanline (regra par-ímpar), vetorizado sobre linhas e arestas."""
+        y_min = max(int(np.floor(points[:, 1].min())), 0)
+        y_max = min(int(np.ceil(points[:, 1].max())), self.height - 1)
+        if y_min > y_max:
+            return
+
+        start, end = points, np.roll(points, -1, axis=0)
+
+        # (R, 1) centros das linhas contra (1, N) arestas
+        rows = np.arange(y_min, y_max + 1)
+        yc = rows[:, None] + 0.5
+        crosses = (start[None, :, 1] <= yc) != (end[None, :, 1] <= yc)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_cross = start[None, :, 0] + (yc - start[None, :, 1]) * (end[None, :, 0] - start[None, :, 0]) / (end[None, :, 1] - start[None, :, 1])
+        x_cross = np.sort(np.where(crosses, x_cross, np.inf), axis=1)
+
+        # pares consecutivos de interseções delimitam os trechos preenchidos
+        count = x_cross.shape[1] - x_cross.shape[1] % 2
+        span_start = x_cross[:, 0:count:2]
+        span_end = x_cross[:, 1:count:2]
+        valid = np.isfinite(span_start) & np.isfinite(span_end)
+
+        first = np.clip(np.ceil(span_start - 0.5), 0, self.width).astype(np.int64)
+        last = np.clip(np.floor(span_end - 0.5) + 1, 0, self.width).astype(np.int64)
+
+        # acumula +1/-1 nas bordas de cada trecho e preenche onde a soma é positiva
+        coverage = np.zeros((len(rows), self.width + 1), dtype=np.int32)
+        row_index = np.broadcast_to(np.arange(len(rows))[:, None], span_start.shape)
+        np.add.at(coverage, (row_index[valid], first[valid]), 1)
+        np.add.at(coverage, (row_index[valid], last[valid]), -1)
+        mask = np.cumsum(coverage[:, :-1], axis=1) > 0
+
+        self.pixels[y_min:y_max + 1][mask] = color
+
+    def oval(self, owner, bbox, fill=None, outline=None, **options):
+        x0, y0, x1, y1 = bbox
+        cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+        rx, ry = max(abs(x1 - x0) / 2, 0.5), max(abs(y1 - y0) / 2, 0.5)
+
+        color = self._rgb(fill) or self._rgb(outline)
+        if color is None:
+            return
+
+        xs = np.arange(max(int(np.floor(cx - rx)), 0), min(int(np.ceil(cx + rx)) + 1, self.width))
+        ys = np.arange(max(int(np.floor(cy - ry)), 0), min(int(np.ceil(cy + ry)) + 1, self.height))
+        if len(xs) == 0 or len(ys) == 0:
+            return
+
+        inside = ((xs[None, :] - cx) / rx) ** 2 + ((ys[:, None] - cy) / ry) ** 2 <= 1
+        self.pixels[ys[0]:ys[-1] + 1, xs[0]:xs[-1] + 1][inside] = color
+
+    def rectangle(self, owner, bbox, fill=None, outline="black", width=1, dash=None, **options):
+        x0, y0, x1, y1 = bbox
+
+        if self._rgb(fill) is not None:
+            self._fill_polygon(np.array([(x0, y0), (x1, y0), (x1, y1), (x0, y1)], dtype=float), self._rgb(fill))
+
+        edges = [(x0, y0, x1, y0), (x1, y0, x1, y1), (x1, y1, x0, y1), (x0, y1, x0, y0)]
+        self.lines(owner, edges, fill=outline, width=width, dash=dash)
+
+
+class TkFramebufferPresenter(Framebuffer):
+    """Framebuffer apresentado em um Canvas do Tk como um único PhotoImage."""
+
+    def __init__(self, canvas, width, height, background):
+        # o canvas é usado para resolver as cores, inclusive a de fundo, no __init__ da base
+        self._canvas = canvas
+        super().__init__(width, height, background)
+        self._photo = None
+        self._image_item = canvas.create_image(0, 0, anchor=tk.NW)
+
+    def _resolve_color(self, color):
+        # o próprio Tk resolve qualquer cor que o Canvas aceitaria; winfo_rgb usa 16 bits por canal
+        try:
+            return tuple(channel >> 8 for channel in self._canvas.winfo_rgb(color))
+        except tk.TclError:
+            return super()._resolve_color(color)
+
+    def end_frame(self):
+        # a referência ao PhotoImage precisa ser mantida, senão o Tk descarta a imagem
+        self._photo = ImageTk.PhotoImage(self.to_image())
+        self._canvas.itemconfigure(self._image_item, image=self._photo)
+
+    def clear(self):
+        super().clear()
+        self._canvas.delete(self._image_item)
+        self._image_item = self._canvas.create_image(0, 0, anchor=tk.NW)
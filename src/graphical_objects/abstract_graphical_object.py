@@ -4,6 +4,11 @@ import numpy as np
 
 class AbstractGraphicalObject(ABC):
 
+    # versão da geometria: incrementada sempre que os vértices mudam. Junto com a versão
+    # da câmera, forma a chave do cache de coordenadas normalizadas (ver Viewport.update_specific_scn)
+    _geometry_version = 0
+    _projection_key = None
+
     def __init__(self, name, id, color):
         self._name = name
         self._id = id
@@ -23,6 +28,10 @@ class AbstractGraphicalObject(ABC):
     def get_vertices(self):
         pass
 
+    def get_render_vertices(self):
+        # vértices que passam pelo pipeline de visualização; curvas usam a tesselação
+        return self.get_vertices()
+
     def get_color(self):
         return self._color
 
@@ -68,3 +77,15 @@ class AbstractGraphicalObject(ABC):
 
     def get_clipped_vertices(self):
         return self._clipped_vertices
+
+    def bump_geometry_version(self):
+        self._geometry_version += 1
+
+    def get_geometry_version(self):
+        return self._geometry_version
+
+    def set_projection_key(self, key):
+        self._projection_key = key
+
+    def get_projection_key(self):
+        return self._projection_key
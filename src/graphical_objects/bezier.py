@@ -1,60 +1,61 @@
-from graphical_objects.wireframe import Wireframe
-from typing import List, Tuple, Sequence
+from graphical_objects.curve import Curve
+from functools import lru_cache
 import numpy as np
-import math
-
-class BezierCurve(Wireframe):
-    def __init__(self, name, id, points, color: str, fill: bool = False):
-        self.curve_coordinates = []
-        self.create_bezier_curve(points)
-        super().__init__(name, id, self.curve_coordinates, color, fill)
-        self.set_type("Curve")
-
-    def create_bezier_curve(self, points):
-        self.curve_coordinates = []
-        for i in range(0, len(points) - 3, 3):
-            segment_points = self.calculate_bezier_curve(
-                points[i], points[i + 1], points[i + 2], points[i + 3]
-            )
-            if i > 0:
-                segment_points = segment_points[1:]
-            self.curve_coordinates.extend(segment_points)
-
-    def calculate_bezier_curve(self, point1, point2, point3, point4):
-        curve_points = []
-
-        matrix_basis = np.array(([-1, 3, -3, 1],
-                       [3, -6, 3, 0],
-                       [-3, 3, 0, 0],
-                       [1, 0, 0, 0]), dtype=float)
-
-        control_points_x = np.array(([float(point1[0])],
-                        [float(point2[0])],
-                        [float(point3[0])],
-                        [float(point4[0])]), dtype=float)
-
-        control_points_y = np.array(([float(point1[1])],
-                        [float(point2[1])],
-                        [float(point3[1])],
-                        [float(point4[1])]), dtype=float)
-
-        curve_points.append((point1[0], point1[1]))
-
-        step = 0.001
-        for i in np.arange(0.0, 1.0 + step, step):
-            t2 = i * i
-            t3 = t2 * i
-            parameter_vector = np.array(([t3, t2, i, 1]), dtype=float)
-            basis_x_parameter = np.dot(parameter_vector, matrix_basis)
-            curve_point_x = np.dot(basis_x_parameter, control_points_x)[0]
-            curve_point_y = np.dot(basis_x_parameter, control_points_y)[0]
-            curve_points.append((curve_point_x, curve_point_y))
-
-        curve_points.append((point4[0], point4[1]))
-
-        return curve_points
-
-    def modify(self, new_coords):
-        self.coordinates = new_coords
-        self.create_bezier_curve(new_coords)
-        return self
\ No newline at end of file
+
+class BezierCurve(Curve):
+
+    # matriz de base da Bézier cúbica na forma [t³ t² t 1] · M · G
+    BASIS_MATRIX = np.array(([-1, 3, -3, 1],
+                             [3, -6, 3, 0],
+                             [-3, 3, 0, 0],
+                             [1, 0, 0, 0]), dtype=float)
+
+    step = 0.001
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _basis_table(step):
+        """
+        Tabela (T, 4) com os pesos de Bernstein de cada amostra de t, calculada uma única
+        vez por passo e compartilhada por todas as curvas.
+        """
+        t = np.arange(0.0, 1.0 + step, step)
+        powers = t[:, None] ** np.array([3, 2, 1, 0])
+        table = powers @ BezierCurve.BASIS_MATRIX
+        table.setflags(write=False)
+        return table
+
+    def _bezier_segments(self, points):
+        # (S, 4, D): os 4 pontos de controle de cada segmento; segmentos vizinhos
+        # compartilham o ponto de junção
+        starts = np.arange(0, len(points) - 3, 3)
+        return points[starts[:, None] + np.arange(4)]
+
+    def _fixed_step_points(self, points):
+        return [tuple(point) for point in self.calculate_bezier_curve(points).tolist()]
+
+    def calculate_bezier_curve(self, points):
+        """
+        Tessela todos os segmentos cúbicos da curva de uma só vez, com passo fixo.
+
+        Args:
+            points: pontos de controle (x, y) ou (x, y, z); cada segmento usa 4 pontos
+                    e compartilha o último com o segmento seguinte.
+
+        Returns:
+            Array (N, D) com os pontos da curva, na ordem dos segmentos.
+        """
+        points = np.array([tuple(p) for p in points], dtype=float)
+        if len(points) < 4:
+            return np.empty((0, points.shape[1] if points.ndim == 2 else 2))
+
+        control = self._bezier_segments(points)
+
+        # (T, 4) x (S, 4, D) -> (S, T, D)
+        samples = np.einsum("tk,skd->std", self._basis_table(self.step), control)
+
+        # cada segmento começa e termina exatamente nos seus pontos de controle extremos
+        segments = np.concatenate([control[:, :1], samples, control[:, 3:]], axis=1)
+
+        # o primeiro ponto de cada segmento após o primeiro repete o último do anterior
+        return np.concatenate([segments[0], segments[1:, 1:].reshape(-1, points.shape[1])])
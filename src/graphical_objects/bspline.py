@@ -1,146 +1,108 @@
-from graphical_objects.wireframe import Wireframe
-from typing import List, Tuple, Sequence
+from graphical_objects.curve import Curve
 import numpy as np
 import math
 
-class BSplineCurve(Wireframe):
-    def __init__(self, name, id, points, color: str, fill: bool = False):
-        self.curve_coordinates = []
-        self.create_bspline_curve(points)
-        super().__init__(name, id, self.curve_coordinates, color, fill)
-        self.set_type("Curve")
+class BSplineCurve(Curve):
 
-    def create_bspline_curve(self, points, step=0.01):
-        processed_points = np.array(points)
-        curve_points = self._calculate_bspline(processed_points, step)
-        self.curve_coordinates = curve_points
+    # matriz de base da B-Spline cúbica uniforme
+    BASIS_MATRIX = (1/6) * np.array([
+        [-1, 3, -3, 1],
+        [3, -6, 3, 0],
+        [-3, 0, 3, 0],
+        [1, 4, 1, 0]
+    ])
+
+    # pontos de controle de Bézier de um segmento B-Spline uniforme: B = (M_bezier⁻¹ · M_bspline) · G
+    BEZIER_CONVERSION = np.array([
+        [1, 4, 1, 0],
+        [0, 4, 2, 0],
+        [0, 2, 4, 0],
+        [0, 1, 4, 1]
+    ], dtype=float) / 6
+
+    step = 0.01
+
+    @staticmethod
+    def _segment_windows(points):
+        # (S, 4, D): janelas deslizantes de 4 pontos de controle
+        return points[np.arange(len(points) - 3)[:, None] + np.arange(4)]
+
+    def _bezier_segments(self, points):
+        return np.einsum("jk,skd->sjd", self.BEZIER_CONVERSION, self._segment_windows(points))
+
+    def _fixed_step_points(self, points):
+        return [tuple(point) for point in self._calculate_bspline(np.array(points, dtype=float), self.step).tolist()]
 
     def _calculate_bspline(self, points, step):
+        """
+        Avalia todos os segmentos da B-Spline com passo fixo.
+
+        Args:
+            points: array (N, D) de pontos de controle, com D qualquer.
+
+        Returns:
+            Array contíguo (S * ceil(1 / step), D), na ordem dos segmentos.
+        """
         if len(points) < 4:
-            return points.tolist()
-            
-        # B-spline basis matrix
-        M = (1/6) * np.array([
-            [-1, 3, -3, 1],
-            [3, -6, 3, 0],
-            [-3, 0, 3, 0],
-            [1, 4, 1, 0]
-        ])
-        
-        curve_points = []
-        
-        for i in range(len(points) - 3):
-            # Get control points for this segment
-            control_points = points[i:i+4]
-            
-            # Calculate curve points using forward differences
-            segment_curve = self._forward_diff_bspline(control_points, M, step)
-            curve_points.extend(segment_curve)
-            
-        return curve_points
-        
+            return points
+
+        return self._forward_diff_bspline(self._segment_windows(points), self.BASIS_MATRIX, step)
+
     def _forward_diff_bspline(self, control_points, M, step):
+        """
+        Diferenças progressivas para vários segmentos ao mesmo tempo.
+
+        Args:
+            control_points: array (S, 4, D) com os pontos de controle de cada segmento.
+        """
         n_steps = math.ceil(1 / step)
-        
-        # Extract coordinates from control points
-        if control_points.shape[1] == 2:  # 2D points
-            px = control_points[:, 0]
-            py = control_points[:, 1]
-            
-            # Calculate coefficients
-            cx = M @ px
-            cy = M @ py
-            
-            # Setup forward differences
-            d1 = step
-            d2 = d1 * step
-            d3 = d2 * step
-            
-            # Create forward difference matrix
-            E = np.array([
-                [0, 0, 0, 1],
-                [d3, d2, d1, 0],
-                [6*d3, 2*d2, 0, 0],
-                [6*d3, 0, 0, 0]
-            ])
-            
-            # Calculate initial values
-            Dx = E @ cx
-            Dy = E @ cy
-            
-            # Generate curve points
-            curve_points = []
-            x, y = Dx[0], Dy[0]
-            
-            for _ in range(n_steps):
-                curve_points.append((x, y))
-                
-                # Update using forward differences
-                x += Dx[1]
-                Dx[1] += Dx[2]
-                Dx[2] += Dx[3]
-                
-                y += Dy[1]
-                Dy[1] += Dy[2]
-                Dy[2] += Dy[3]
-                
-            return curve_points
-            
-        elif control_points.shape[1] == 3:  # 3D points
-            px = control_points[:, 0]
-            py = control_points[:, 1]
-            pz = control_points[:, 2]
-            
-            # Calculate coefficients
-            cx = M @ px
-            cy = M @ py
-            cz = M @ pz
-            
-            # Setup forward differences
-            d1 = step
-            d2 = d1 * step
-            d3 = d2 * step
-            
-            # Create forward difference matrix
-            E = np.array([
-                [0, 0, 0, 1],
-                [d3, d2, d1, 0],
-                [6*d3, 2*d2, 0, 0],
-                [6*d3, 0, 0, 0]
-            ])
-            
-            # Calculate initial values
-            Dx = E @ cx
-            Dy = E @ cy
-            Dz = E @ cz
-            
-            # Generate curve points
-            curve_points = []
-            x, y, z = Dx[0], Dy[0], Dz[0]
-            
-            for _ in range(n_steps):
-                curve_points.append((x, y, z))
-                
-                # Update using forward differences
-                x += Dx[1]
-                Dx[1] += Dx[2]
-                Dx[2] += Dx[3]
-                
-                y += Dy[1]
-                Dy[1] += Dy[2]
-                Dy[2] += Dy[3]
-                
-                z += Dz[1]
-                Dz[1] += Dz[2]
-                Dz[2] += Dz[3]
-                
-            return curve_points
-            
-        else:
-            raise ValueError("Points must be 2D or 3D")
-        
-    def modify(self, new_coords):
-        self.coordinates = new_coords
-        self.create_bspline_curve(new_coords)
-        super().modify(self.curve_coordinates)
-        return self
+
+        # valores iniciais (f, Δ1, Δ2, Δ3) de cada segmento: (S, 4, D)
+        initial = np.einsum("ij,jk,skd->sid", self.forward_difference_matrix(step), M, control_points)
+        curve = self.forward_differences(initial, n_steps)
+
+        return np.ascontiguousarray(curve.reshape(-1, control_points.shape[2]))
+
+    @staticmethod
+    def forward_difference_matrix(step):
+        """Matriz E que leva os coeficientes [a b c d] de um cúbico a (f, Δ1, Δ2, Δ3) em t = 0."""
+        d1 = step
+        d2 = d1 * step
+        d3 = d2 * step
+
+        return np.array([
+            [0, 0, 0, 1],
+            [d3, d2, d1, 0],
+            [6*d3, 2*d2, 0, 0],
+            [6*d3, 0, 0, 0]
+        ])
+
+    @staticmethod
+    def forward_differences(initial, n_steps):
+        """
+        Avança tabelas de diferenças progressivas por n_steps passos.
+
+        O laço escalar (x += Δ1; Δ1 += Δ2; Δ2 += Δ3) é substituído por somas acumuladas
+        ao longo dos passos: Δ2 cresce linearmente, Δ1 é a soma acumulada de Δ2 e os
+        pontos são a soma acumulada de Δ1.
+
+        Args:
+            initial: array (S, 4, ...) com (f, Δ1, Δ2, Δ3) de cada tabela.
+
+        Returns:
+            Array (S, n_steps, ...) com o valor de f em cada passo.
+        """
+        f0, delta1, delta2, delta3 = (initial[:, None, i] for i in range(4))
+
+        steps = np.arange(n_steps).reshape((1, n_steps) + (1,) * (initial.ndim - 2))
+        delta2 = delta2 + steps * delta3
+        delta1 = delta1 + BSplineCurve._exclusive_cumsum(delta2)
+
+        return f0 + BSplineCurve._exclusive_cumsum(delta1)
+
+    @staticmethod
+    def _exclusive_cumsum(values):
+        # soma acumulada ao longo dos passos, sem incluir o passo atual
+        result = np.zeros_like(values)
+        np.cumsum(values[:, :-1], axis=1, out=result[:, 1:])
+        return result
@@ -0,0 +1,153 @@
+from abc import abstractmethod
+from graphical_objects.wireframe import Wireframe
+import constants as c
+import numpy as np
+
+class Curve(Wireframe):
+    """
+    Base das curvas cúbicas por partes (Bézier e B-Spline).
+
+    Guarda os pontos de controle e a tesselação atual (em `coordinates`, que é o que
+    passa pelo pipeline de visualização). A tesselação pode ser:
+
+    - c.CURVE_TESSELLATION_FIXED: passo fixo em t, como originalmente;
+    - c.CURVE_TESSELLATION_ADAPTIVE: subdivisão de De Casteljau até que cada trecho
+      esteja a menos de `tolerance` da sua corda. Com `tolerance_in_pixels`, a
+      tolerância é medida em pixels de tela e a curva é re-tesselada quando a escala
+      da window muda (ver set_pixel_size).
+    """
+
+    def __init__(self, name, id, points, color: str, fill: bool = False,
+                 tessellation=c.CURVE_TESSELLATION, tolerance=c.CURVE_FLATNESS_TOLERANCE,
+                 tolerance_in_pixels=True):
+        self.control_points = [tuple(p) for p in points]
+        self.tessellation = tessellation
+        self.tolerance = tolerance
+        self.tolerance_in_pixels = tolerance_in_pixels
+
+        # unidades de mundo por pixel até o primeiro frame informar a escala real
+        (x_min, _), (x_max, _) = c.WINDOW_BOUNDS
+        self._pixel_size = (x_max - x_min) / c.VIEWPORT_WIDTH
+
+        super().__init__(name, id, self.tessellate(), color, fill)
+        self.set_type("Curve")
+
+    def get_vertices(self):
+        # as transformações (translação, escala, rotação) são afins e atuam nos pontos de controle
+        return self.control_points
+
+    def get_render_vertices(self):
+        return self.coordinates
+
+    def set_tessellation(self, tessellation, tolerance=None, tolerance_in_pixels=None):
+        """Altera o modo de tesselação desta curva e a re-tessela."""
+        self.tessellation = tessellation
+        if tolerance is not None:
+            self.tolerance = tolerance
+        if tolerance_in_pixels is not None:
+            self.tolerance_in_pixels = tolerance_in_pixels
+        self._retessellate()
+
+    def set_pixel_size(self, pixel_size):
+        """
+        Informa quantas unidades de mundo cabem em um pixel da viewport. Só causa
+        re-tesselação em curvas adaptativas com tolerância em pixels.
+        """
+        if pixel_size == self._pixel_size:
+            return
+        self._pixel_size = pixel_size
+
+        if self.tessellation == c.CURVE_TESSELLATION_ADAPTIVE and self.tolerance_in_pixels:
+            self._retessellate()
+
+    def _retessellate(self):
+        self.coordinates = self.tessellate()
+        self.bump_geometry_version()
+
+    def tessellate(self):
+        if len(self.control_points) < 4:
+            return list(self.control_points)
+
+        if self.tessellation == c.CURVE_TESSELLATION_FIXED:
+            return self._fixed_step_points(self.control_points)
+
+        if self.tessellation != c.CURVE_TESSELLATION_ADAPTIVE:
+            raise ValueError(f"modo de tesselação desconhecido: {self.tessellation}")
+
+        tolerance = self.tolerance * self._pixel_size if self.tolerance_in_pixels else self.tolerance
+        points = np.array(self.control_points, dtype=float)
+        curve = self.subdivide_adaptive(self._bezier_segments(points), tolerance)
+        return [tuple(point) for point in curve.tolist()]
+
+    @abstractmethod
+    def _bezier_segments(self, points):
+        """Pontos de controle de Bézier (S, 4, D) equivalentes a cada segmento da curva."""
+        pass
+
+    @abstractmethod
+    def _fixed_step_points(self, points):
+        """Tesselação com passo fixo em t."""
+        pass
+
+    @staticmethod
+    def subdivide_adaptive(segments, tolerance, max_depth=c.CURVE_MAX_SUBDIVISION_DEPTH):
+        """
+        Subdivide segmentos de Bézier cúbicos até que todos sejam planos o suficiente.
+
+        Cada nível processa todos os trechos pendentes de uma vez; ao final os trechos
+        aceitos são reordenados por (segmento, t inicial).
+
+        Args:
+            segments: array (S, 4, D) com os pontos de controle de cada segmento.
+            tolerance: distância máxima entre um trecho e a sua corda.
+
+        Returns:
+            Array (N, D) com os pontos da curva: o início de cada trecho mais o fim do último.
+        """
+        pending = segments
+        segment_index = np.arange(len(segments))
+        t_start = np.zeros(len(segments))
+
+        accepted, accepted_index, accepted_t = [], [], []
+
+        for depth in range(max_depth + 1):
+            p0, p1, p2, p3 = pending[:, 0], pending[:, 1], pending[:, 2], pending[:, 3]
+
+            # cota da distância da curva à corda: max(|3P1 - 2P0 - P3|, |3P2 - P0 - 2P3|) / 4
+            ux = (3 * p1 - 2 * p0 - p3) ** 2
+            vx = (3 * p2 - p0 - 2 * p3) ** 2
+            flat = np.maximum(ux, vx).sum(axis=1) <= 16 * tolerance ** 2
+            if depth == max_depth:
+                flat[:] = True
+
+            accepted.append(pending[flat])
+            accepted_index.append(segment_index[flat])
+            accepted_t.append(t_start[flat])
+
+            if flat.all():
+                break
+
+            # De Casteljau em t = 0.5
+            p0, p1, p2, p3 = p0[~flat], p1[~flat], p2[~flat], p3[~flat]
+            p01, p12, p23 = (p0 + p1) / 2, (p1 + p2) / 2, (p2 + p3) / 2
+            p012, p123 = (p01 + p12) / 2, (p12 + p23) / 2
+            middle = (p012 + p123) / 2
+
+            left = np.stack([p0, p01, p012, middle], axis=1)
+            right = np.stack([middle, p123, p23, p3], axis=1)
+
+            half = 0.5 ** (depth + 1)
+            pending = np.concatenate([left, right])
+            segment_index = np.concatenate([segment_index[~flat], segment_index[~flat]])
+            t_start = np.concatenate([t_start[~flat], t_start[~flat] + half])
+
+        pieces = np.concatenate(accepted)
+        order = np.lexsort((np.concatenate(accepted_t), np.concatenate(accepted_index)))
+        pieces = pieces[order]
+
+        return np.concatenate([pieces[:, 0], pieces[-1:, 3]])
+
+    def modify(self, new_coords):
+        self.control_points = [tuple(p) for p in new_coords]
+        self._retessellate()
+        return self
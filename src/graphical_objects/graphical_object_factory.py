@@ -4,7 +4,7 @@ from graphical_objects.line import Line
 from graphical_objects.wireframe import Wireframe
 from graphical_objects.objeto3d import Object3D
 from graphical_objects.ponto3d import Ponto3D
-from graphical_objects.surfaces3d import BezierSurface
+from graphical_objects.surfaces3d import BezierSurface, BSplineSurface
 import constants as c
 
 class GraphicalObjectFactory:
@@ -15,14 +15,15 @@ class GraphicalObjectFactory:
                 "Wireframe": Wireframe,
                 "3DObject": Object3D,
                 "3DPoint": Ponto3D,
-                "BezierSurface": BezierSurface
+                "BezierSurface": BezierSurface,
+                "BSplineSurface": BSplineSurface
             }
 
     @staticmethod
-    def create_object(object_type: str, name: str, object_id: int, coordinates: tuple, color: str, fill: bool, curve_type: str, surface_type: str):
+    def create_object(object_type: str, name: str, object_id: int, coordinates: tuple, color: str, fill: bool, curve_type: str, surface_type: str, columns: int = None):
 
         if (isinstance(object_type, AbstractGraphicalObject)):
-            GraphicalObjectFactory.duplicate_object(object_type, name, object_id)
+            return GraphicalObjectFactory.duplicate_object(object_type, name, object_id)
 
         if (object_type == "Curve"):
             if curve_type == c.CURVE_TYPE_BEZIER:
@@ -36,6 +37,9 @@ class GraphicalObjectFactory:
         
         if (object_type == "Surface"):
             obj_class = GraphicalObjectFactory.object_classes[surface_type]
+            if obj_class is BSplineSurface:
+                # grade m x n: o número de colunas desambigua a quantidade de pontos
+                return obj_class(name, object_id, coordinates, color, fill, columns=columns)
             return obj_class(name, object_id, coordinates, color, fill)
     
         if object_type in GraphicalObjectFactory.object_classes:
@@ -48,4 +52,5 @@ class GraphicalObjectFactory:
     def duplicate_object(obj: AbstractGraphicalObject, name: str, id: int):
         new_obj = obj.clone()
         new_obj.update_name(name)
+        new_obj.update_id(id)
         return new_obj
@@ -21,14 +21,16 @@ class Line(AbstractGraphicalObject):
     
     def modify(self, new_coords):
         self.coordinates = new_coords
+        self.bump_geometry_version()
         return self
     
     def draw(self, canvas):
         if self.in_window:
-            viewport_x0, viewport_y0 = canvas.window_to_viewport(*self._scn_vertices[0])
-            viewport_x1, viewport_y1 = canvas.window_to_viewport(*self._scn_vertices[1])
-            canvas.create_line(
-                viewport_x0, viewport_y0,
-                viewport_x1, viewport_y1,
+            viewport_line = canvas.window_to_viewport_array(self._clipped_vertices).reshape(1, 4)
+            canvas.items.lines(
+                self,
+                viewport_line.tolist(),
                 fill=self._color
-            )
\ No newline at end of file
+            )
+        else:
+            canvas.items.hide(self)
\ No newline at end of file
@@ -0,0 +1,307 @@
+import os
+import numpy as np
+from graphical_objects.objeto3d import Object3D
+
+# registro de um triângulo no STL binário: normal, 3 vértices e o "attribute byte count"
+STL_TRIANGLE = np.dtype([
+    ("normal", "<f4", (3,)),
+    ("vertices", "<f4", (3, 3)),
+    ("attribute", "<u2"),
+])
+
+STL_HEADER_SIZE = 84
+
+
+class StlHandler:
+    """Binary STL import/export; triangle records are mapped straight from disk."""
+
+    @staticmethod
+    def read_stl(file_path):
+        """
+        Reads a binary STL file.
+
+        Returns:
+            Tuple (vertices, edges, faces): the welded (V, 3) vertices, the unique
+            (E, 2) triangle edges and the (F, 3) non-degenerate triangles.
+        """
+        size = os.path.getsize(file_path)
+        if size < STL_HEADER_SIZE:
+            raise ValueError("Not a binary STL file: too short")
+
+        count = int(np.fromfile(file_path, dtype="<u4", count=1, offset=80)[0])
+        if size != STL_HEADER_SIZE + count * STL_TRIANGLE.itemsize:
+            raise ValueError("Not a binary STL file (ASCII STL is not supported)")
+
+        if count == 0:
+            return np.empty((0, 3)), np.empty((0, 2), dtype=np.int32), np.empty((0, 3), dtype=np.int32)
+
+        triangles = np.memmap(file_path, dtype=STL_TRIANGLE, mode="r", offset=STL_HEADER_SIZE, shape=(count,))
+
+        # o STL repete os vértices em cada triângulo: solda os coincidentes
+        corners = triangles["vertices"].reshape(-1, 3).astype(float)
+        vertices, inverse = Object3D._weld(corners)
+        faces = inverse.reshape(-1, 3)
+        edges = Object3D.face_edges(faces)
+
+        # triângulos degenerados (ex.: (a, b, b) gravados por save_stl para arestas soltas)
+        # contribuem só com as suas arestas, não viram faces
+        degenerate = (faces[:, 0] == faces[:, 1]) | (faces[:, 1] == faces[:, 2]) | (faces[:, 0] == faces[:, 2])
+
+        return vertices, edges, faces[~degenerate]
+
+    @staticmethod
+    def save_stl(file_path, obj: Object3D):
+        """
+        Writes a 3D object as binary STL. Edges that are not the side of any face
+        (all of them, for plain wireframes) are written as one degenerate triangle
+        (a, b, b) each, which reads back as the same edge.
+        """
+        vertices = obj.get_vertex_buffer()
+        loose = obj.get_loose_edges()
+        faces = np.concatenate([obj.get_face_buffer(), np.column_stack([loose, loose[:, 1]])])
+
+        records = np.zeros(len(faces), dtype=STL_TRIANGLE)
+        records["vertices"] = vertices[faces]
+
+        a, b, c = (records["vertices"][:, i].astype(float) for i in range(3))
+        normals = np.cross(b - a, c - a)
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        records["normal"] = np.divide(normals, lengths, out=np.zeros_like(normals), where=lengths > 0)
+
+        header = f"{obj.get_name()}"[:80].encode("ascii", errors="replace").ljust(80, b" ")
+
+        with open(file_path, "wb") as file:
+            file.write(header)
+            file.write(np.uint32(len(records)).astype("<u4").tobytes())
+            records.tofile(file)
+
+
+PLY_TYPES = {
+    "char": "i1", "int8": "i1",
+    "uchar": "u1", "uint8": "u1",
+    "short": "i2", "int16": "i2",
+    "ushort": "u2", "uint16": "u2",
+    "int": "i4", "int32": "i4",
+    "uint": "u4", "uint32": "u4",
+    "float": "f4", "float32": "f4",
+    "double": "f8", "float64": "f8",
+}
+
+
+class PlyHandler:
+    """
+    Binary PLY import/export. Elements with only scalar properties (vertex, edge)
+    and faces with a constant vertex count are read through np.memmap with
+    structured dtypes.
+    """
+
+    @staticmethod
+    def _read_header(file):
+        """
+        Returns (byte_order, elements, data_offset); elements is a list of
+        (name, count, properties), each property being (name, type) for scalars
+        or (name, (count_type, item_type)) for lists.
+        """
+        if file.readline().strip() != b"ply":
+            raise ValueError("Not a PLY file")
+
+        byte_order = None
+        elements = []
+        while True:
+            line = file.readline()
+            if not line:
+                raise ValueError("PLY header without end_header")
+
+            parts = line.decode("ascii", errors="replace").split()
+            if not parts or parts[0] in ("comment", "obj_info"):
+                continue
+
+            if parts[0] == "format":
+                if parts[1] == "binary_little_endian":
+                    byte_order = "<"
+                elif parts[1] == "binary_big_endian":
+                    byte_order = ">"
+                else:
+                    raise ValueError("Only binary PLY files are supported")
+
+            elif parts[0] == "element":
+                elements.append((parts[1], int(parts[2]), []))
+
+            elif parts[0] == "property":
+                if parts[1] == "list":
+                    elements[-1][2].append((parts[4], (PLY_TYPES[parts[2]], PLY_TYPES[parts[3]])))
+                else:
+                    elements[-1][2].append((parts[2], PLY_TYPES[parts[1]]))
+
+            elif parts[0] == "end_header":
+                return byte_order, elements, file.tell()
+
+    @staticmethod
+    def _element_dtype(byte_order, properties, list_length=None):
+        """Structured dtype of one element; list properties get a fixed list_length."""
+        fields = []
+        for name, kind in properties:
+            if isinstance(kind, tuple):
+                count_type, item_type = kind
+                fields.append((name + "_count", byte_order + count_type))
+                fields.append((name, byte_order + item_type, (list_length,)))
+            else:
+                fields.append((name, byte_order + kind))
+        return np.dtype(fields)
+
+    @staticmethod
+    def _read_element(mapped, offset, byte_order, count, properties):
+        """
+        Returns (records, size_in_bytes). Lists are first tried with the length of
+        the first record; elements whose lists vary in length fall back to a
+        sequential scan.
+        """
+        list_properties = [kind for _, kind in properties if isinstance(kind, tuple)]
+        if not list_properties:
+            dtype = PlyHandler._element_dtype(byte_order, properties)
+            records = np.frombuffer(mapped, dtype=dtype, count=count, offset=offset)
+            return records, count * dtype.itemsize
+
+        if len(list_properties) > 1:
+            raise ValueError("PLY elements with more than one list property are not supported")
+
+        count_type = np.dtype(byte_order + list_properties[0][0])
+        first_length = int(np.frombuffer(mapped, dtype=count_type, count=1, offset=offset)[0]) if count else 0
+
+        dtype = PlyHandler._element_dtype(byte_order, properties, first_length)
+        if offset + count * dtype.itemsize <= len(mapped):
+            records = np.frombuffer(mapped, dtype=dtype, count=count, offset=offset)
+            list_name = next(name for name, kind in properties if isinstance(kind, tuple))
+            if (records[list_name + "_count"] == first_length).all():
+                return records, count * dtype.itemsize
+
+        return PlyHandler._read_variable_element(mapped, offset, byte_order, count, properties)
+
+    @staticmethod
+    def _read_variable_element(mapped, offset, byte_order, count, properties):
+        # listas de tamanho variável: cada registro depende do tamanho do anterior
+        start = offset
+        records = {name: [] for name, _ in properties}
+        for _ in range(count):
+            for name, kind in properties:
+                if isinstance(kind, tuple):
+                    count_type, item_type = (np.dtype(byte_order + t) for t in kind)
+                    length = int(np.frombuffer(mapped, dtype=count_type, count=1, offset=offset)[0])
+                    offset += count_type.itemsize
+                    records[name].append(np.frombuffer(mapped, dtype=item_type, count=length, offset=offset))
+                    offset += length * item_type.itemsize
+                else:
+                    dtype = np.dtype(byte_order + kind)
+                    records[name].append(np.frombuffer(mapped, dtype=dtype, count=1, offset=offset)[0])
+                    offset += dtype.itemsize
+        return records, offset - start
+
+    @staticmethod
+    def read_ply(file_path):
+        """
+        Reads a binary PLY file with a 'vertex' element and optional 'face' and
+        'edge' elements.
+
+        Returns:
+            Tuple (vertices, edges, faces): (V, 3) vertices, the unique (E, 2) edges
+            (explicit edges plus face edges) and the (F, 3) triangles (polygonal
+            faces are fan-triangulated).
+        """
+        with open(file_path, "rb") as file:
+            byte_order, elements, data_offset = PlyHandler._read_header(file)
+
+        mapped = np.memmap(file_path, dtype=np.uint8, mode="r")
+
+        vertices = np.empty((0, 3))
+        edge_lists = [np.empty((0, 2), dtype=np.int64)]
+        faces = np.empty((0, 3), dtype=np.int64)
+
+        offset = data_offset
+        for name, count, properties in elements:
+            records, size = PlyHandler._read_element(mapped, offset, byte_order, count, properties)
+            offset += size
+
+            if name == "vertex":
+                vertices = np.column_stack([np.asarray(records[axis], dtype=float) for axis in ("x", "y", "z")])
+
+            elif name == "face":
+                list_name = next(n for n, kind in properties if isinstance(kind, tuple))
+                polygons = records[list_name]
+                faces = PlyHandler._triangulate(polygons)
+                edge_lists.append(PlyHandler._polygon_edges(polygons))
+
+            elif name == "edge":
+                edge_lists.append(np.column_stack([np.asarray(records["vertex1"]), np.asarray(records["vertex2"])]))
+
+        edges = np.concatenate(edge_lists)
+        in_range = ((edges >= 0) & (edges < len(vertices))).all(axis=1)
+        faces_in_range = ((faces >= 0) & (faces < len(vertices))).all(axis=1)
+
+        return vertices, Object3D.unique_edges(edges[in_range]), faces[faces_in_range].astype(np.int32)
+
+    @staticmethod
+    def _triangulate(polygons):
+        if isinstance(polygons, np.ndarray):
+            # (F, k): leque a partir do primeiro vértice de cada face
+            k = polygons.shape[1]
+            if k < 3:
+                return np.empty((0, 3), dtype=np.int64)
+            fans = [np.column_stack([polygons[:, 0], polygons[:, i], polygons[:, i + 1]]) for i in range(1, k - 1)]
+            return np.concatenate(fans).astype(np.int64)
+
+        triangles = [
+            (polygon[0], polygon[i], polygon[i + 1])
+            for polygon in polygons for i in range(1, len(polygon) - 1)
+        ]
+        return np.array(triangles, dtype=np.int64).reshape(-1, 3)
+
+    @staticmethod
+    def _polygon_edges(polygons):
+        if isinstance(polygons, np.ndarray):
+            polygons = np.asarray(polygons, dtype=np.int64)
+            return np.stack([polygons, np.roll(polygons, -1, axis=1)], axis=-1).reshape(-1, 2)
+
+        edges = [
+            (polygon[i], polygon[(i + 1) % len(polygon)])
+            for polygon in polygons for i in range(len(polygon))
+        ]
+        return np.array(edges, dtype=np.int64).reshape(-1, 2)
+
+    @staticmethod
+    def save_ply(file_path, obj: Object3D):
+        """Writes a 3D object as binary little-endian PLY with vertex, face and edge elements."""
+        vertices = obj.get_vertex_buffer()
+        edges = obj.get_edge_buffer()
+        faces = obj.get_face_buffer()
+
+        vertex_records = np.empty(len(vertices), dtype=[("x", "<f8"), ("y", "<f8"), ("z", "<f8")])
+        vertex_records["x"], vertex_records["y"], vertex_records["z"] = vertices.T
+
+        face_records = np.empty(len(faces), dtype=[("count", "u1"), ("indices", "<i4", (3,))])
+        face_records["count"] = 3
+        face_records["indices"] = faces
+
+        edge_records = np.empty(len(edges), dtype=[("vertex1", "<i4"), ("vertex2", "<i4")])
+        edge_records["vertex1"], edge_records["vertex2"] = edges.T
+
+        header = "\n".join([
+            "ply",
+            "format binary_little_endian 1.0",
+            f"comment {obj.get_name()}",
+            f"element vertex {len(vertices)}",
+            "property double x",
+            "property double y",
+            "property double z",
+            f"element face {len(faces)}",
+            "property list uchar int vertex_indices",
+            f"element edge {len(edges)}",
+            "property int vertex1",
+            "property int vertex2",
+            "end_header",
+        ]) + "\n"
+
+        with open(file_path, "wb") as file:
+            file.write(header.encode("ascii", errors="replace"))
+            vertex_records.tofile(file)
+            face_records.tofile(file)
+            edge_records.tofile(file)
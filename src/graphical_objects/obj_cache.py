@@ -0,0 +1,177 @@
+import hashlib
+import mmap
+import os
+import zipfile
+import numpy as np
+import constants as c
+
+class ObjGeometryCache:
+    """
+    Binary cache of parsed .obj geometry, so re-opening a model skips text parsing.
+
+    Each source file has one .npz entry (named after a hash of its absolute path)
+    holding the vertex and edge arrays, the 'o'/'g' group ranges, and the size,
+    mtime and content hash of the source. An entry is valid while the size matches and either the mtime matches
+    or the content hash still does. The mtime of the entry itself is its last use;
+    the least recently used entries are evicted when the cache exceeds max_bytes
+    or max_entries.
+    """
+
+    HASH_BLOCK_SIZE = 8 * 1024 * 1024
+
+    def __init__(self, directory=c.OBJ_CACHE_DIR, max_bytes=c.OBJ_CACHE_MAX_BYTES,
+                 max_entries=c.OBJ_CACHE_MAX_ENTRIES, compressed=c.OBJ_CACHE_COMPRESSED,
+                 mmap_mode=c.OBJ_CACHE_MMAP_MODE):
+        self.directory = os.path.expanduser(directory)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        # entradas comprimidas não podem ser mapeadas em memória
+        self.compressed = compressed
+        self.mmap_mode = None if compressed else mmap_mode
+
+    def _entry_path(self, file_path):
+        key = hashlib.blake2b(os.path.abspath(file_path).encode(), digest_size=16).hexdigest()
+        return os.path.join(self.directory, key + ".npz")
+
+    @classmethod
+    def content_hash(cls, file_path):
+        digest = hashlib.blake2b(digest_size=20)
+        with open(file_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size > 0:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    for start in range(0, len(mapped), cls.HASH_BLOCK_SIZE):
+                        digest.update(mapped[start:start + cls.HASH_BLOCK_SIZE])
+        return digest.hexdigest()
+
+    def get(self, file_path):
+        """
+        Returns the cached (vertices, edges, groups) of file_path, or None if there
+        is no valid entry.
+        """
+        entry = self._entry_path(file_path)
+        if not os.path.exists(entry):
+            return None
+
+        stat = os.stat(file_path)
+        try:
+            with np.load(entry) as data:
+                size, mtime_ns = (int(v) for v in data["source_stat"])
+                source_hash = str(data["source_hash"])
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            self._remove(entry)
+            return None
+
+        if size != stat.st_size:
+            return None
+        if mtime_ns != stat.st_mtime_ns and source_hash != self.content_hash(file_path):
+            return None
+
+        try:
+            if mtime_ns != stat.st_mtime_ns:
+                # mesmo conteúdo com outro mtime (touch, checkout): grava o stat atual para
+                # que as próximas aberturas não precisem refazer o hash
+                self._refresh_stat(entry, stat)
+            vertices, edges, groups = self._load_arrays(entry)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            self._remove(entry)
+            return None
+
+        # marca a entrada como usada agora (relógio do LRU)
+        os.utime(entry)
+        return vertices, edges, groups
+
+    def put(self, file_path, vertices, edges, groups):
+        """Stores the parsed geometry of file_path and evicts old entries if needed."""
+        os.makedirs(self.directory, exist_ok=True)
+
+        stat = os.stat(file_path)
+        self._write(
+            self._entry_path(file_path),
+            vertices=np.ascontiguousarray(vertices),
+            edges=np.ascontiguousarray(edges),
+            group_names=np.array([name for name, _, _ in groups], dtype=str),
+            group_ranges=np.array([(start, end) for _, start, end in groups], dtype=np.int64).reshape(-1, 2),
+            source_stat=np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64),
+            source_hash=np.array(self.content_hash(file_path))
+        )
+
+        self.evict()
+
+    def _write(self, entry, **arrays):
+        temporary = entry + ".tmp"
+        save = np.savez_compressed if self.compressed else np.savez
+        with open(temporary, 'wb') as file:
+            save(file, **arrays)
+        # troca atômica: um leitor nunca vê uma entrada pela metade
+        os.replace(temporary, entry)
+
+    def _refresh_stat(self, entry, stat):
+        """Rewrites entry with the current size and mtime of its source, keeping everything else."""
+        # lido inteiro (sem mmap): o arquivo da entrada é substituído logo em seguida
+        with np.load(entry) as data:
+            arrays = {name: data[name] for name in data.files}
+        arrays["source_stat"] = np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+        self._write(entry, **arrays)
+
+    def evict(self):
+        """Removes the least recently used entries until the cache fits its limits."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".npz"):
+                path = os.path.join(self.directory, name)
+                stat = os.stat(path)
+                entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        entries.sort(reverse=True)
+        total = 0
+        for count, (_, size, path) in enumerate(entries, start=1):
+            total += size
+            # a entrada mais recente fica sempre, mesmo que sozinha exceda o limite
+            if count > 1 and (total > self.max_bytes or count > self.max_entries):
+                self._remove(path)
+
+    def clear(self):
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith(".npz"):
+                    self._remove(os.path.join(self.directory, name))
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _load_arrays(self, entry):
+        with np.load(entry) as data:
+            # entradas anteriores aos grupos não têm estas chaves (KeyError invalida a entrada)
+            groups = [(str(name), int(start), int(end)) for name, (start, end) in zip(data["group_names"], data["group_ranges"])]
+            if self.mmap_mode is None:
+                return data["vertices"], data["edges"], groups
+
+        # np.load ignora mmap_mode em .npz; como os membros são gravados sem compressão,
+        # cada .npy está contíguo dentro do zip e pode ser mapeado diretamente
+        return self._memmap_member(entry, "vertices"), self._memmap_member(entry, "edges"), groups
+
+    def _memmap_member(self, entry, name):
+        with zipfile.ZipFile(entry) as archive:
+            info = archive.getinfo(name + ".npy")
+        if info.compress_type != zipfile.ZIP_STORED:
+            raise ValueError(f"{name} is compressed and cannot be memory-mapped")
+
+        with open(entry, 'rb') as file:
+            # cabeçalho local do zip: 30 bytes fixos + nome + campo extra
+            file.seek(info.header_offset + 26)
+            name_length, extra_length = np.frombuffer(file.read(4), dtype="<u2")
+            file.seek(info.header_offset + 30 + int(name_length) + int(extra_length))
+
+            version = np.lib.format.read_magic(file)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+            offset = file.tell()
+
+        return np.memmap(entry, dtype=dtype, mode=self.mmap_mode, offset=offset, shape=shape,
+                         order="F" if fortran_order else "C")
@@ -1,3 +1,4 @@
+import copy
 import numpy as np
 from graphical_objects.wireframe import Wireframe
 from graphical_objects.ponto3d import Ponto3D
@@ -8,8 +9,11 @@ class Object3D(Wireframe):
         Initialize a 3D object as a wireframe model.
         
         Args:
-            segments: Optional list of line segments, where each segment
-                      is a pair (tuple or list) of Ponto3D objects.[0] newCube (3DObject)
+            coordinates: Flat list of segment endpoints (tuples or Ponto3D objects),
+                         where each consecutive pair defines one segment.
+        
+        The geometry is stored as an indexed buffer: a (V, 3) float array of
+        unique vertices and an (E, 2) int32 array of vertex indices per edge.
         """
         self._name = name
         self._fill = fill
@@ -17,61 +21,253 @@ class Object3D(Wireframe):
         self._color = color
         self._clipped_vertices = None
         self._type = "3DObject"
-        self.vertices = coordinates
-        self.segments = []
-        for i in range(0, len(coordinates) - 1, 2):
-            self.add_segment(coordinates[i], coordinates[i + 1])
-        self.in_window = [False] * len(self.segments)
+        self._vertex_buffer = np.empty((0, 3), dtype=float)
+        self._edge_buffer = np.empty((0, 2), dtype=np.int32)
+        self._face_buffer = np.empty((0, 3), dtype=np.int32)
+        self.add_segments(self._pair_points(coordinates))
+        self.in_window = [False] * len(self._edge_buffer)
+
+    @classmethod
+    def from_arrays(cls, name, id, vertices, edges, color: str, fill=False, faces=None):
+        """
+        Build an object directly from an indexed vertex/edge buffer.
+        
+        Args:
+            vertices: Array-like of shape (V, 3)
+            edges: Array-like of shape (E, 2) with indices into vertices
+            faces: Optional array-like of shape (F, 3) with the triangles the
+                   edges came from (kept only for export)
+        """
+        obj = cls(name, id, [], color, fill)
+        obj.set_geometry(vertices, edges, faces)
+        return obj
+
+    @classmethod
+    def from_shared_buffer(cls, name, id, vertices, edges, color: str, fill=False):
+        """
+        Build an object over part of a vertex buffer shared with other objects.
+        
+        Only the range of vertices referenced by edges is kept, as a view of
+        vertices (no copy), and the edges are rebased to it. Transformations
+        replace the buffer with a new array, so they never touch the other
+        objects sharing it.
+        
+        Args:
+            vertices: Float array of shape (V, 3), shared by all the parts
+            edges: Array-like of shape (E, 2) with indices into vertices
+        """
+        edges = np.asarray(edges).reshape(-1, 2)
+        if len(edges) == 0:
+            return cls.from_arrays(name, id, np.empty((0, 3)), edges, color, fill)
+        
+        first, last = int(edges.min()), int(edges.max()) + 1
+        return cls.from_arrays(name, id, vertices[first:last], edges - first, color, fill)
+
+    def set_geometry(self, vertices, edges, faces=None):
+        """
+        Replace the object geometry with the given vertex and edge buffers.
+        
+        Args:
+            vertices: Array-like of shape (V, 3)
+            edges: Array-like of shape (E, 2) with indices into vertices
+            faces: Optional array-like of shape (F, 3) with triangle indices
+        """
+        self._vertex_buffer = np.ascontiguousarray(vertices, dtype=float).reshape(-1, 3)
+        self._edge_buffer = np.ascontiguousarray(edges, dtype=np.int32).reshape(-1, 2)
+        self._face_buffer = np.ascontiguousarray(
+            faces if faces is not None else np.empty((0, 3)), dtype=np.int32
+        ).reshape(-1, 3)
+        self.in_window = [False] * len(self._edge_buffer)
+        self.bump_geometry_version()
+
+    def get_vertex_buffer(self):
+        """Return the (V, 3) array of unique vertices."""
+        return self._vertex_buffer
+
+    def get_edge_buffer(self):
+        """Return the (E, 2) int32 array of vertex indices of each segment."""
+        return self._edge_buffer
+
+    def get_face_buffer(self):
+        """Return the (F, 3) int32 array of triangles (empty when the object has no faces)."""
+        return self._face_buffer
+
+    def get_loose_edges(self):
+        """Return the (L, 2) edges that are not a side of any face (all edges when there are no faces)."""
+        edges, faces = self._edge_buffer, self._face_buffer
+        if len(faces) == 0:
+            return edges
+
+        count = np.int64(len(self._vertex_buffer))
+        def keys(pairs):
+            pairs = np.sort(pairs.astype(np.int64), axis=1)
+            return pairs[:, 0] * count + pairs[:, 1]
+        return edges[~np.isin(keys(edges), keys(self.face_edges(faces)))]
+
+    @staticmethod
+    def _pair_points(coordinates):
+        """Group a flat list of endpoints into an (E, 2, 3) array, dropping an unpaired last point."""
+        if isinstance(coordinates, np.ndarray):
+            points = coordinates.astype(float, copy=False).reshape(-1, 3)
+        else:
+            points = np.array([tuple(p) for p in coordinates], dtype=float).reshape(-1, 3)
+        
+        count = len(points) - len(points) % 2
+        return points[:count].reshape(-1, 2, 3)
+
+    @staticmethod
+    def _weld(points, tolerance=0.0):
+        """
+        Merge coincident points.
+        
+        Args:
+            points: Array of shape (N, 3)
+            tolerance: Points closer than this on every axis are always merged, and so
+                       are chains of such points; points up to twice this apart may be
+                       merged too. 0 merges only exact duplicates.
+        
+        Returns:
+            Tuple (unique, inverse) where unique keeps the order of first
+            occurrence and points == unique[inverse] (up to the tolerance).
+        """
+        if len(points) == 0:
+            return points.reshape(0, 3), np.empty(0, dtype=np.int32)
+        
+        if tolerance <= 0:
+            _, first, inverse = np.unique(points, axis=0, return_index=True, return_inverse=True)
+            # np.unique ordena lexicograficamente; reordena pela primeira ocorrência
+            order = np.argsort(first, kind="stable")
+            rank = np.empty_like(order)
+            rank[order] = np.arange(len(order))
+            return points[first[order]], rank[inverse.reshape(-1)].astype(np.int32)
+        
+        # 8 grades de células de lado 2*tolerance, deslocadas de 0 ou tolerance em cada
+        # eixo: dois pontos a menos de tolerance em todos os eixos caem na mesma célula
+        # em pelo menos uma delas, mesmo quando uma borda de célula passa entre eles
+        cells = []
+        for offset in np.array(np.meshgrid([0, 1], [0, 1], [0, 1])).reshape(3, -1).T:
+            keys = np.floor((points + offset * tolerance) / (2 * tolerance)).astype(np.int64)
+            cells.append(np.unique(keys, axis=0, return_inverse=True)[1].reshape(-1))
+        
+        # cada ponto fica com o menor índice do seu componente (o da primeira ocorrência)
+        labels = np.arange(len(points))
+        while True:
+            previous = labels
+            for inverse in cells:
+                smallest = np.full(inverse.max() + 1, len(points))
+                np.minimum.at(smallest, inverse, labels)
+                labels = smallest[inverse]
+            if np.array_equal(labels, previous):
+                break
+        
+        # rótulos crescentes = componentes na ordem da primeira ocorrência
+        first, inverse = np.unique(labels, return_inverse=True)
+        return points[first], inverse.reshape(-1).astype(np.int32)
+
+    @staticmethod
+    def face_edges(faces):
+        """
+        Return the unique edges of a set of triangles.
+        
+        Args:
+            faces: Array-like of shape (F, 3) with vertex indices
+        """
+        faces = np.asarray(faces).reshape(-1, 3)
+        return Object3D.unique_edges(np.stack([faces, np.roll(faces, -1, axis=1)], axis=-1).reshape(-1, 2))
+
+    @staticmethod
+    def unique_edges(edges):
+        """
+        Drop repeated edges (in either direction) and degenerate ones.
+        
+        Args:
+            edges: Array-like of shape (E, 2) with vertex indices
+        
+        Returns:
+            Int32 array of shape (E', 2), in order of first occurrence.
+        """
+        edges = np.asarray(edges, dtype=np.int32).reshape(-1, 2)
+        edges = edges[edges[:, 0] != edges[:, 1]]
+        if len(edges) == 0:
+            return edges
+        
+        _, first = np.unique(np.sort(edges, axis=1), axis=0, return_index=True)
+        return edges[np.sort(first)]
         
     def add_segment(self, point1, point2):
         """
         Add a line segment to the object.
         
         Args:
-            point1: Ponto3D object for the first point of the segment
-            point2: Ponto3D object for the second point of the segment
+            point1: Ponto3D object or (x, y, z) tuple for the first point of the segment
+            point2: Ponto3D object or (x, y, z) tuple for the second point of the segment
         """
-        if isinstance(point1, tuple):
-            point1 = Ponto3D(point1[0], point1[1], point1[2])
-        if isinstance(point2, tuple):
-            point2 = Ponto3D(point2[0], point2[1], point2[2])
-
-        self.segments.append((point1.clone(), point2.clone()))
-        for p in (point1, point2):
-            if p not in self.vertices:
-                self.vertices.append(p)
+        self.add_segments([(point1, point2)])
         
     def add_segments(self, segments):
         """
         Add multiple line segments to the object.
         
         Args:
-            segments: List of pairs of Ponto3D objects
+            segments: List of pairs of Ponto3D objects or (x, y, z) tuples,
+                      or an array of shape (E, 2, 3)
         """
-        for p1, p2 in segments:
-            self.add_segment(p1, p2)
+        if not isinstance(segments, np.ndarray):
+            segments = np.array([(tuple(p1), tuple(p2)) for p1, p2 in segments], dtype=float)
+        
+        new_points = segments.reshape(-1, 3)
+        if len(new_points) == 0:
+            return
+        
+        # os vértices existentes vêm primeiro; remapeia as arestas antigas caso o weld
+        # tenha fundido vértices que coincidiram após alguma transformação
+        old_count = len(self._vertex_buffer)
+        vertices, inverse = self._weld(np.vstack([self._vertex_buffer, new_points]))
+        old_edges = inverse[:old_count][self._edge_buffer]
+        new_edges = inverse[old_count:].reshape(-1, 2)
+        
+        self._face_buffer = inverse[:old_count][self._face_buffer].astype(np.int32)
+        self._vertex_buffer = vertices
+        self._edge_buffer = np.vstack([old_edges, new_edges]).astype(np.int32)
+        self.in_window = [False] * len(self._edge_buffer)
+        self.bump_geometry_version()
+
+    @property
+    def segments(self):
+        """List of (Ponto3D, Ponto3D) pairs built from the indexed buffers (read-only view)."""
+        return [
+            (Ponto3D(*self._vertex_buffer[i]), Ponto3D(*self._vertex_buffer[j]))
+            for i, j in self._edge_buffer
+        ]
+
+    @segments.setter
+    def segments(self, segments):
+        self._vertex_buffer = np.empty((0, 3), dtype=float)
+        self._edge_buffer = np.empty((0, 2), dtype=np.int32)
+        self._face_buffer = np.empty((0, 3), dtype=np.int32)
+        self.add_segments(segments)
+
+    @property
+    def vertices(self):
+        """List of unique (x, y, z) vertices."""
+        return self.get_vertices()
     
-    def _apply_point_transformation(self, transformation, *args, **kwargs):
+    def _apply_matrix(self, matrix):
         """
-        Apply a transformation to all points in the object.
+        Apply a 4x4 transformation matrix to every vertex of the object.
         
         Args:
-            transformation: Name of the transformation method from Ponto3D class
-            *args, **kwargs: Arguments to pass to the transformation method
-        """
-        new_segments = []
-        for p1, p2 in self.segments:
-            # Apply transformation to copies of points to avoid modifying originals
-            new_p1 = p1.clone()
-            new_p2 = p2.clone()
-            
-            # Call the specified method on each point
-            getattr(new_p1, transformation)(*args, **kwargs)
-            getattr(new_p2, transformation)(*args, **kwargs)
-            
-            new_segments.append((new_p1, new_p2))
+            matrix: 4x4 homogeneous transformation matrix
+        """
+        homogeneous = np.hstack([self._vertex_buffer, np.ones((len(self._vertex_buffer), 1))])
+        result = homogeneous @ matrix.T
+        
+        # normaliza para coordenadas homogêneas, como em Ponto3D._apply_transform
+        w = result[:, 3:4]
+        w = np.where(np.abs(w) > 1e-10, w, 1.0)
         
-        self.segments = new_segments
+        self._vertex_buffer = np.ascontiguousarray(result[:, :3] / w)
+        self.bump_geometry_version()
         return self
     
     def translate(self, dx, dy, dz):
@@ -81,7 +277,7 @@ class Object3D(Wireframe):
         Args:
             dx, dy, dz: Displacement along each axis
         """
-        return self._apply_point_transformation('translate', dx, dy, dz)
+        return self._apply_matrix(Ponto3D.translation_matrix(dx, dy, dz))
     
     def scale(self, sx, sy=None, sz=None, origin=None):
         """
@@ -91,7 +287,7 @@ class Object3D(Wireframe):
             sx, sy, sz: Scale factors for each axis
             origin: Optional point around which to perform the scaling
         """
-        return self._apply_point_transformation('scale', sx, sy, sz, origin=origin)
+        return self._apply_matrix(Ponto3D.scale_matrix(sx, sy, sz, origin))
     
     def rotate(self, angle_x=0, angle_y=0, angle_z=0, origin=None):
         """
@@ -101,9 +297,7 @@ class Object3D(Wireframe):
             angle_x, angle_y, angle_z: Rotation angles in degrees
             origin: Optional point around which to perform the rotation
         """
-        return self._apply_point_transformation('rotate', 
-                                               angle_x, angle_y, angle_z, 
-                                               origin=origin)
+        return self._apply_matrix(Ponto3D.rotation_matrix(angle_x, angle_y, angle_z, origin))
     
     def rotate_around_axis(self, axis_start, axis_end, angle_degrees):
         """
@@ -167,29 +361,17 @@ class Object3D(Wireframe):
             rot_matrix = t2 @ rot_matrix @ t1
         
         # Apply the transformation to all points
-        new_segments = []
-        for p1, p2 in self.segments:
-            new_p1 = p1.clone()
-            new_p2 = p2.clone()
-            
-            new_p1.transform(rot_matrix)
-            new_p2.transform(rot_matrix)
-            
-            new_segments.append((new_p1, new_p2))
-        
-        self.segments = new_segments
-        return self
+        return self._apply_matrix(rot_matrix)
     
     def __repr__(self):
         """String representation of the 3D object."""
-        return f"Object3D with {len(self.segments)} segments"
+        return f"Object3D with {len(self._edge_buffer)} segments"
     
     def clone(self):
-        """Create a copy of the object."""
-        new_object = Object3D()
-        for p1, p2 in self.segments:
-            new_object.add_segment(p1, p2)
-        return new_object
+        """Create a copy of the object, keeping its class and parameters (e.g. surface columns)."""
+        obj = copy.copy(self)
+        obj.set_geometry(self._vertex_buffer.copy(), self._edge_buffer.copy(), self._face_buffer.copy())
+        return obj
     
     def center(self):
         """
@@ -199,32 +381,25 @@ class Object3D(Wireframe):
             A Ponto3D object representing the center point of the object.
             Returns None if the object has no segments.
         """
-        if not self.segments:
+        if len(self._edge_buffer) == 0:
             return None
         
-        all_points = self.get_vertices()
-        
-        num_points = len(all_points)
-        sum_x = sum(p[0] for p in all_points)
-        sum_y = sum(p[1] for p in all_points)
-        sum_z = sum(p[2] for p in all_points)
-        
-        from ponto3d import Ponto3D
+        used = np.unique(self._edge_buffer)
         
-        return Ponto3D(
-            sum_x / num_points,
-            sum_y / num_points,
-            sum_z / num_points
-        )
+        return Ponto3D(*self._vertex_buffer[used].mean(axis=0))
     
     def get_vertices(self):
-        all_points = set()
-        for p1, p2 in self.segments:
-            # Convert to tuple for hashability (assuming Ponto3D has x, y, z attributes)
-            all_points.add((p1.x, p1.y, p1.z))
-            all_points.add((p2.x, p2.y, p2.z))
-        return list(all_points)
-    
+        return [tuple(v) for v in self._vertex_buffer[np.unique(self._edge_buffer)].tolist()]
+
+    def get_segment_array(self):
+        """
+        Return the segment endpoints packed as a float array.
+
+        Returns:
+            Array of shape (E, 2, 3) with the (x, y, z) of both ends of each segment.
+        """
+        return self._vertex_buffer[self._edge_buffer]
+
     def set_normalized_segments(self, segments):
         self.normalized_segments = segments
     
@@ -232,26 +407,10 @@ class Object3D(Wireframe):
         return self.normalized_segments
     
     def draw(self, canvas):
-        lines = self.get_normalized_segments()
-        
-        for i in range(len(lines)):
+        lines = self.get_clipped_vertices()
+
+        # (E, 2, 2) normalizado -> (E, 4) em coordenadas de viewport; segmentos clipados
+        # só têm o item correspondente escondido
+        viewport_lines = canvas.window_to_viewport_array(lines).reshape(-1, 4)
 
-                if not self.in_window[i]:
-                    continue
-                x0, y0 = canvas.window_to_viewport(*lines[i][0])
-                x1, y1 = canvas.window_to_viewport(*lines[i][1])
-                canvas.create_line(
-                x0, y0,
-                x1, y1,
-                fill=self._color
-            )
-                # x0, y0 = canvas.window_to_viewport(*lines[i][1])
-                # try:
-                #     x1, y1 = canvas.window_to_viewport(*lines[i + 1][0])
-                #     canvas.create_line(
-                #         x0, y0,
-                #         x1, y1,
-                #         fill=self._color
-                #     )
-                # except IndexError:
-                #     pass
\ No newline at end of file
+        canvas.items.lines(self, viewport_lines.tolist(), self.in_window, fill=self._color)
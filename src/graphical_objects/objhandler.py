@@ -1,6 +1,17 @@
 from graphical_objects.abstract_graphical_object import AbstractGraphicalObject
+from graphical_objects.objeto3d import Object3D
+import constants as c
 
-import typing
+import mmap
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+
+
+class ObjImportCancelled(Exception):
+    """Raised when an .obj import is cancelled before it finishes."""
 
 class ObjHandler:
     # Classe feita com auxílio de IA (Claude), dada a natureza extensiva de parsing
@@ -21,306 +32,607 @@ class ObjHandler:
             return None
 
     @staticmethod
-    def process_obj_data(obj_data: str, app):
+    def read_obj(file_path, chunk_size=c.OBJ_CHUNK_SIZE, progress=None, cancel=None, batch=None):
         """
-        Processes the loaded .obj data (string) and creates a 3D wireframe
-        object using the application's create_object method.
+        Streams an .obj file once and returns its wireframe geometry.
 
-        It extracts vertices ('v') and defines segments based on face ('f') definitions.
-        Handles comments ('#') in the OBJ data.
+        The file is memory-mapped and parsed in chunks of about chunk_size bytes,
+        each converted to arrays before the next one is read, so peak memory follows
+        the size of the geometry rather than of the text.
 
         Args:
-            obj_data: A string containing the content of an .obj file.
-            app: The application object with a create_object method.
+            progress: Optional callable receiving the fraction of the file parsed (0 to 1).
+            cancel: Optional callable; when it returns True the import stops with
+                    ObjImportCancelled.
+            batch: Optional callable receiving the (vertices, edges) arrays added by
+                   each chunk, for progressive display. Edge indices are absolute
+                   and may refer to vertices of later chunks.
+
+        Returns:
+            Tuple (vertices, edges, groups): a (V, 3) float array, an (E, 2) int32
+            array of 0-based vertex index pairs sorted by group, and the
+            (name, start, end) edge range of each 'o'/'g' group.
         """
-        vertices: typing.List[typing.Tuple[float, float, float]] = []
-        segments_set: typing.Set[typing.Tuple[typing.Tuple[float, float, float], typing.Tuple[float, float, float]]] = set()
+        parser = ObjParser()
+        for text in ObjHandler.iter_chunks(file_path, chunk_size, progress, cancel):
+            parser.feed_text(text)
+            if batch is not None:
+                batch(*parser.take_new_arrays())
+        return parser.finish()
 
-        lines = obj_data.strip().split('\n')
+    @staticmethod
+    def iter_chunks(file_path, chunk_size=c.OBJ_CHUNK_SIZE, progress=None, cancel=None):
+        """
+        Yields the text of a file in chunks that always end at a line boundary.
 
-        print("Processing OBJ data...")
+        Args:
+            progress, cancel: See read_obj.
+        """
+        with open(file_path, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            if size == 0:
+                return
 
-        # Primeiro, leia todos os vértices
-        # Processa todas as linhas, mas só age nas que começam com 'v'
-        for line in lines:
-            # Ignora ou remove a parte do comentário (#...)
-            comment_index = line.find('#')
-            if comment_index != -1:
-                line = line[:comment_index].strip()
-            else:
-                line = line.strip()
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                position = 0
+                while position < size:
+                    if cancel is not None and cancel():
+                        raise ObjImportCancelled(file_path)
 
-            parts = line.split()
-            if not parts: # Ignora linhas vazias após remover comentário
-                continue
+                    end = ObjHandler._chunk_end(mapped, position, chunk_size)
+                    yield mapped[position:end].decode('utf-8', errors='replace')
 
-            prefix = parts[0]
+                    position = end
+                    if progress is not None:
+                        progress(position / size)
 
-            if prefix == 'v':
-                # Processa linha de vértice: v x y z
-                try:
-                    x, y, z = float(parts[1]), float(parts[2]), float(parts[3])
-                    vertices.append((x, y, z))
-                except (ValueError, IndexError):
-                    print(f"Warning: Skipping malformed vertex line: {line}")
-                    continue
-
-        print(f"Found {len(vertices)} vertices.")
-        if not vertices:
-            print("Error: No vertices found in OBJ data.")
-            return # Não podemos processar sem vértices
-
-        # Agora, processe as faces para extrair as arestas
-        # Percorre as linhas novamente, agindo nas que começam com 'f'
-        for line in lines:
-            # Ignora ou remove a parte do comentário (#...)
-            comment_index = line.find('#')
-            if comment_index != -1:
-                line = line[:comment_index].strip()
-            else:
-                line = line.strip()
-
-            parts = line.split()
-            if not parts: # Ignora linhas vazias após remover comentário
-                continue
-
-            prefix = parts[0]
-
-            if prefix == 'f':
-                # Processa linha de face: f v1 v2 v3 ...
-                # Índices são baseados em 1. Podem ter o formato v/vt/vn
-                try:
-                    # Obtém apenas o índice do vértice (ignora /vt e /vn)
-                    face_indices_str = parts[1:]
-                    
-                    # Verifica se há índices válidos na linha 'f'
-                    if not face_indices_str:
-                        print(f"Warning: Skipping face line with no vertex indices: {line}")
-                        continue
+    @staticmethod
+    def read_obj_parallel(file_path, workers=c.OBJ_IMPORT_WORKERS, chunk_size=c.OBJ_CHUNK_SIZE, progress=None, cancel=None):
+        """
+        Same as read_obj, but parses the chunks in a pool of worker processes.
 
-                    # Converte strings de índice para inteiros
-                    face_indices = [int(p.split('/')[0]) for p in face_indices_str if p.split('/')[0].isdigit()]
+        The file is split at line boundaries. Positive indices are already absolute;
+        negative (relative) ones are kept relative to the start of their chunk and
+        rebased here with the number of vertices each worker actually read, so the
+        result matches read_obj exactly. The per-chunk vertex arrays are
+        concatenated in file order. The 'o'/'g' names in effect at the start of
+        each chunk are found while splitting, and the per-chunk group names are
+        merged by name.
 
-                    # Uma face precisa de pelo menos 2 vértices para definir um segmento
-                    if len(face_indices) < 2:
-                         print(f"Warning: Skipping face with less than 2 valid vertex indices: {line}")
-                         continue
+        Args:
+            workers: Number of worker processes; None uses the CPU count.
+            chunk_size, progress, cancel: See read_obj.
+        """
+        size = os.path.getsize(file_path)
+        if size <= chunk_size or workers == 1:
+            return ObjHandler.read_obj(file_path, chunk_size, progress, cancel)
+
+        ranges, states = ObjHandler._split_ranges(file_path, chunk_size)
+
+        results = [None] * len(ranges)
+        parsed = 0
+
+        # spawn: o import roda numa thread de um processo com Tk, e fork de um processo
+        # com várias threads pode travar o filho
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            futures = {
+                executor.submit(_parse_obj_range, file_path, start, end, state): i
+                for i, ((start, end), state) in enumerate(zip(ranges, states))
+            }
+            try:
+                for future in as_completed(futures):
+                    if cancel is not None and cancel():
+                        raise ObjImportCancelled(file_path)
+
+                    i = futures[future]
+                    results[i] = future.result()
+
+                    start, end = ranges[i]
+                    parsed += end - start
+                    if progress is not None:
+                        progress(parsed / size)
+            except BaseException:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+        # renumera os grupos de cada bloco pelos nomes, na ordem do arquivo
+        group_index = {}
+        group_chunks = []
+        for _, _, names, groups in results:
+            mapping = np.array([group_index.setdefault(name, len(group_index)) for name in names], dtype=np.int64)
+            group_chunks.append(mapping[groups])
+
+        # índices relativos: soma os vértices lidos pelos blocos anteriores
+        counts = np.array([len(result[0]) for result in results], dtype=np.int64)
+        offsets = np.cumsum(counts) - counts
+        for (_, chunk_edges, _, _), offset in zip(results, offsets):
+            relative = chunk_edges < -ObjParser.RELATIVE_INDEX_SHIFT // 2
+            chunk_edges[relative] += ObjParser.RELATIVE_INDEX_SHIFT + offset
+
+        vertices = np.concatenate([result[0] for result in results])
+        edges = np.concatenate([result[1] for result in results])
+        return (vertices, *ObjParser.validate_edges(edges, np.concatenate(group_chunks), list(group_index), len(vertices)))
+
+    @staticmethod
+    def _chunk_end(mapped, position, chunk_size):
+        """End of the chunk starting at position: about chunk_size bytes, cut at a line boundary."""
+        size = len(mapped)
+        end = min(position + chunk_size, size)
+        if end == size:
+            return end
+
+        # recua até o último fim de linha do bloco; uma linha maior que o bloco
+        # inteiro avança até o seu próprio fim
+        newline = mapped.rfind(b'\n', position, end)
+        if newline == -1:
+            newline = mapped.find(b'\n', end)
+        return size if newline == -1 else newline + 1
 
-                    # Cria segmentos entre vértices consecutivos na face, incluindo fechar o loop
-                    num_indices = len(face_indices)
-                    for i in range(num_indices):
-                        # Índices do vértice atual e do próximo (com wrap-around para fechar)
-                        idx1_obj = face_indices[i]
-                        idx2_obj = face_indices[(i + 1) % num_indices] # % num_indices para fechar o ciclo
+    @staticmethod
+    def _split_ranges(file_path, chunk_size):
+        """
+        Splits a file into line-aligned (start, end) byte ranges.
 
-                        # Converte índices .obj (base 1) para índices da lista Python (base 0)
-                        idx1_list = idx1_obj - 1
-                        idx2_list = idx2_obj - 1
+        Returns:
+            Tuple (ranges, states), where states[i] holds the (object, group) names
+            in effect at the start of ranges[i].
+        """
+        ranges, states = [], []
+        state = ("", "")
 
-                        # Verifica se os índices são válidos na lista de vértices
-                        if idx1_list < 0 or idx1_list >= len(vertices) or idx2_list < 0 or idx2_list >= len(vertices):
-                             print(f"Warning: Skipping segment due to out-of-bounds vertex index: {idx1_obj} or {idx2_obj} (Total vertices: {len(vertices)}) from line: {line}")
-                             continue
+        with open(file_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            size = len(mapped)
+            position = 0
+            while position < size:
+                end = ObjHandler._chunk_end(mapped, position, chunk_size)
+                ranges.append((position, end))
+                states.append(state)
 
-                        # Obtém as coordenadas dos vértices
-                        v1_coords = vertices[idx1_list]
-                        v2_coords = vertices[idx2_list]
+                state = ObjHandler._group_state_after(mapped[position:end], state)
+                position = end
 
-                        # Cria uma representação canônica da aresta (tupla de coordenadas, ordenada)
-                        canonical_segment = tuple(sorted((v1_coords, v2_coords)))
+        return ranges, states
 
-                        segments_set.add(canonical_segment)
+    # candidatas a linhas 'o'/'g' (com ou sem indentação); confirmadas como em ObjParser.feed
+    _GROUP_LINE = re.compile(rb'^[ \t\r\f\v]*[og]', re.MULTILINE)
 
-                except (ValueError, IndexError):
-                     # Esta exceção agora deve ser mais rara, pois tratamos comentários e falta de índices
-                     print(f"Warning: Skipping face line due to unexpected format error: {line}")
-                     continue
+    @staticmethod
+    def _group_state_after(block, state):
+        """(object, group) names in effect after a block of lines, given the ones before it."""
+        object_name, group_name = state
 
+        for match in ObjHandler._GROUP_LINE.finditer(block):
+            end = block.find(b'\n', match.start())
+            line = block[match.start():end if end != -1 else len(block)].decode('utf-8', errors='replace')
 
-            # Ignora outros tipos de linhas (vn, vt, usemtl, s, etc.)
+            parts = line.partition('#')[0].split()
+            if parts and parts[0] == 'o':
+                object_name, group_name = " ".join(parts[1:]), ""
+            elif parts and parts[0] == 'g':
+                group_name = " ".join(parts[1:])
 
-        # Agora, formatar os segmentos encontrados no formato string requerido
-        segments_string_parts = []
-        for seg_point1, seg_point2 in segments_set:
-             # Formata as coordenadas com precisão para floating point
-             segments_string_parts.append(f"({seg_point1[0]:.6f}, {seg_point1[1]:.6f}, {seg_point1[2]:.6f}), ({seg_point2[0]:.6f}, {seg_point2[1]:.6f}, {seg_point2[2]:.6f}), ")
+        return object_name, group_name
 
-        # Junta as partes da string e remove a vírgula e espaço finais ", "
-        segments_string = "".join(segments_string_parts).rstrip(", ")
+    @staticmethod
+    def process_obj_data(obj_data: str, app):
+        """
+        Processes already loaded .obj data (string) and creates a 3D wireframe
+        object, or one object per 'o'/'g' group, through the application.
 
-        print(f"Extracted {len(segments_set)} unique segments.")
+        Args:
+            obj_data: A string containing the content of an .obj file.
+            app: The application object with create_object_from_arrays and
+                 create_objects_from_groups methods.
+        """
+        parser = ObjParser()
+        parser.feed_text(obj_data)
+        vertices, edges, groups = parser.finish()
 
-        if not segments_string:
+        if len(edges) == 0:
             print("Warning: No valid segments found for creating the object.")
             return # Não cria um objeto vazio
 
-        # Cria o objeto usando o método da aplicação
-        object_name = "LoadedObjModel" # Nome padrão
-        object_color = "blue"      # Cor padrão
-
-        print(f"Creating object '{object_name}' with {len(segments_set)} segments.")
-
-        if hasattr(app, 'create_object') and callable(app.create_object):
-             try:
-                 app.create_object(
-                     "3DObject",          # Tipo de objeto
-                     segments_string,     # A string de pares de coordenadas
-                     object_name,         # Nome
-                     object_color         # Cor
-                 )
-                 print("OBJ object processing complete. Object created successfully.")
-             except Exception as e:
-                 print(f"Error calling app.create_object: {e}")
+        if len(groups) > 1:
+            app.create_objects_from_groups(vertices, edges, groups, "blue")
         else:
-             print("Error: Provided 'app' object does not have a callable 'create_object' method.")
+            app.create_object_from_arrays("LoadedObjModel", vertices, edges, "blue")
 
     @staticmethod
     def save_obj(file_path, obj: AbstractGraphicalObject):
-        """Saves the object data as a .obj file (2D or 3D)."""
+        """Saves one object as a .obj file (2D objects are written with z = 0)."""
+        ObjHandler.save_objects(file_path, [obj])
+
+    @staticmethod
+    def save_objects(file_path, objects):
+        """
+        Streams several objects into one .obj file, each as its own 'o' group.
+
+        Vertices and elements are formatted in bulk blocks and written straight to a
+        buffered file handle; vertex indices are offset by the vertices written for
+        the previous groups.
+
+        - 3DObject (and surfaces): the indexed vertex buffer, one 'f' per triangle
+          when the object has faces and one 'l' per edge not covered by a face
+        - Wireframe: its vertices plus one 'f' (closed polygon)
+        - Line and Curve: an 'l' polyline through the (tessellated) vertices
+        - Point and 3DPoint: just the vertex
+        """
+        with open(file_path, 'w', buffering=c.OBJ_WRITE_BUFFER_SIZE) as file:
+            file.write(f"# {len(objects)} object(s)\n")
+
+            vertex_offset = 0
+            for obj in objects:
+                vertices, elements = ObjHandler._export_topology(obj)
+
+                file.write(f"o {ObjHandler._group_name(obj)}\n")
+                color = obj.get_color()
+                if color:
+                    file.write(f"usemtl {ObjHandler._material_name(color)}\n")
+
+                ObjHandler._write_rows(file, "v", vertices)
+                for keyword, indices in elements:
+                    ObjHandler._write_rows(file, keyword, indices + vertex_offset + 1)
+
+                vertex_offset += len(vertices)
+
+    @staticmethod
+    def _export_topology(obj):
+        """
+        Returns (vertices, elements): a (V, 3) float array and a list of
+        (keyword, indices) pairs, keyword being 'l' or 'f' and indices an (N, k)
+        array of 0-based vertex indices, one row per record.
+        """
+        obj_type = obj.get_type()
+
+        if obj_type == "3DObject":
+            vertices, faces = obj.get_vertex_buffer(), obj.get_face_buffer()
+            if len(faces) == 0:
+                return vertices, [("l", obj.get_edge_buffer())]
+
+            # arestas que já aparecem em alguma face não precisam de um 'l' próprio
+            return vertices, [("f", faces), ("l", obj.get_loose_edges())]
+
+        if obj_type == "3DPoint":
+            return np.array([tuple(obj)], dtype=float), []
+
+        if obj_type in ("Point", "Line", "Wireframe", "Curve"):
+            points = [tuple(v)[:3] for v in obj.get_render_vertices()]
+            vertices = np.zeros((len(points), 3))
+            if points:
+                vertices[:, :len(points[0])] = points
+
+            chain = np.arange(len(vertices)).reshape(1, -1)
+            if obj_type == "Point":
+                return vertices, []
+            if obj_type == "Wireframe":
+                return vertices, [("f", chain)]
+            return vertices, [("l", chain)]
+
+        raise ValueError(f"Unsupported object type: {obj_type}")
+
+    @staticmethod
+    def _write_rows(file, keyword, rows, block_rows=c.OBJ_WRITE_BLOCK_ROWS):
+        """
+        Writes one '<keyword> a b c ...' record per row of a 2D array, formatting
+        block_rows rows per string operation. Floats are written with repr, so
+        they round-trip exactly.
+        """
+        rows = np.asarray(rows)
+        if rows.size == 0:
+            return
+
+        field = "%r" if rows.dtype.kind == 'f' else "%d"
+        line = keyword + (" " + field) * rows.shape[1] + "\n"
+
+        for start in range(0, len(rows), block_rows):
+            block = rows[start:start + block_rows]
+            file.write((line * len(block)) % tuple(block.ravel().tolist()))
+
+    @staticmethod
+    def _group_name(obj):
+        # nomes de grupo não podem conter espaços
+        return "_".join(str(obj.get_name()).split()) or f"object_{obj.get_id()}"
+
+    @staticmethod
+    def _material_name(color):
+        # converte cores hexadecimais conhecidas para o nome do material
+        return next((name for name, hex_value in {
+            "red": "#FF0000",
+            "green": "#00FF00",
+            "blue": "#0000FF",
+            "yellow": "#FFFF00",
+            "cyan": "#00FFFF",
+            "magenta": "#FF00FF",
+            "white": "#FFFFFF",
+            "black": "#000000",
+        }.items() if hex_value.lower() == color.lower()), color)
+
+
+class ObjParser:
+    """
+    Accumulates the wireframe geometry of an .obj file in a single pass.
+
+    Vertex coordinates and face/polyline indices are kept as raw tokens while
+    reading and converted to numpy arrays in bulk by flush(), which read_obj calls
+    after every chunk. Faces ('f') become closed loops of edges, polylines ('l')
+    open chains; other records are ignored.
+
+    Every edge also records the group it was read in: 'o' starts a new object and
+    'g' a group inside it, named "object/group" (or "default" before any of them).
+    Repeated names add to the same group.
+
+    With resolve_relative=False (used by the parallel reader, which does not know
+    how many vertices precede a chunk) negative indices are resolved against the
+    vertices read by this parser only and stored shifted by -RELATIVE_INDEX_SHIFT,
+    so they never collide with absolute indices; the caller rebases them.
+    """
+
+    RELATIVE_INDEX_SHIFT = 1 << 40
+
+    def __init__(self, vertex_offset=0, object_name="", group_name="", resolve_relative=True):
+        # vértices definidos antes do texto lido por este parser
+        self._vertex_count = vertex_offset
+        self._resolve_relative = resolve_relative
+        self._vertex_chunks = []    # arrays (n, 3) já convertidos
+        self._edge_chunks = []      # arrays (m, 2) de índices base 0
+        self._group_chunks = []     # arrays (m,) com o grupo de cada aresta
+        self._taken = (0, 0)        # blocos já entregues por take_new_arrays
+
+        # o/g em vigor no início do texto (ver read_obj_parallel)
+        self._object_name = object_name
+        self._group_name = group_name
+        self._group_index = {}      # nome -> índice, na ordem de primeira ocorrência
+        self._current_group = None  # índice do grupo atual, resolvido no primeiro elemento
+        self._reset_pending()
+
+    def _reset_pending(self):
+        self._vertex_tokens = []    # x, y, z de cada vértice, ainda como texto
+        self._index_tokens = []     # índices de todas as faces/linhas, em sequência
+        self._sizes = []            # número de índices de cada face/linha
+        self._closed = []           # True para faces (fecham o ciclo), False para linhas
+        self._vertex_base = []      # vértices lidos até cada face (para índices negativos)
+        self._element_groups = []   # grupo de cada face/linha
+
+    def feed_text(self, text):
+        """Processes a block of complete lines and converts it to arrays."""
+        for line in text.splitlines():
+            self.feed(line)
+        self.flush()
+
+    def feed(self, line):
+        """Processes one line of .obj text."""
+        comment_index = line.find('#')
+        if comment_index != -1:
+            line = line[:comment_index]
+
+        parts = line.split()
+        if not parts:
+            return
+
+        prefix = parts[0]
+
+        if prefix == 'v':
+            if len(parts) < 4:
+                print(f"Warning: Skipping malformed vertex line: {line.strip()}")
+                return
+            self._vertex_tokens.extend(parts[1:4])
+            self._vertex_count += 1
+
+        elif prefix == 'f' or prefix == 'l':
+            # só o índice do vértice interessa (ignora /vt e /vn)
+            indices = [p.partition('/')[0] for p in parts[1:]]
+            if len(indices) < 2:
+                print(f"Warning: Skipping element with less than 2 vertex indices: {line.strip()}")
+                return
+            self._index_tokens.extend(indices)
+            self._sizes.append(len(indices))
+            self._closed.append(prefix == 'f')
+            self._vertex_base.append(self._vertex_count)
+
+            if self._current_group is None:
+                self._current_group = self._resolve_group()
+            self._element_groups.append(self._current_group)
+
+        elif prefix == 'o':
+            self._object_name = " ".join(parts[1:])
+            self._group_name = ""
+            self._current_group = None
+
+        elif prefix == 'g':
+            self._group_name = " ".join(parts[1:])
+            self._current_group = None
+
+    def _resolve_group(self):
+        name = "/".join(n for n in (self._object_name, self._group_name) if n) or "default"
+        return self._group_index.setdefault(name, len(self._group_index))
+
+    def flush(self):
+        """Converts the tokens read since the last flush into vertex and edge arrays."""
+        if self._vertex_tokens:
+            rows = len(self._vertex_tokens) // 3
+            vertices, dropped = self._to_vertex_array(self._vertex_tokens)
+
+            # vértices malformados descartados não contam para os índices seguintes: cada
+            # face/linha desconta os descartados lidos antes dela, como se tivessem sido
+            # rejeitados já em feed(), independentemente de onde caem os blocos
+            if len(dropped) and self._sizes:
+                base = np.array(self._vertex_base, dtype=np.int64)
+                chunk_start = self._vertex_count - rows
+                self._vertex_base = base - np.searchsorted(dropped, base - chunk_start, side='left')
+
+            self._vertex_count -= len(dropped)
+            self._vertex_chunks.append(vertices)
+
+        if self._sizes:
+            edges, groups = self._build_edges()
+            self._edge_chunks.append(edges)
+            self._group_chunks.append(groups)
+
+        self._reset_pending()
+
+    def _build_edges(self):
+        try:
+            indices = np.array(self._index_tokens).astype(np.int64)
+        except ValueError:
+            # conversão em lote falhou: descarta apenas as faces/linhas com índices inválidos
+            self._drop_malformed_elements()
+            if not self._sizes:
+                return np.empty((0, 2), dtype=np.int64), np.empty(0, dtype=np.int64)
+            indices = np.array(self._index_tokens).astype(np.int64)
+        sizes = np.array(self._sizes, dtype=np.int64)
+
+        # índices do .obj começam em 1; negativos são relativos ao último vértice lido
+        negative = indices < 0
+        if negative.any():
+            indices[negative] += np.repeat(np.array(self._vertex_base, dtype=np.int64), sizes)[negative] + 1
+            if not self._resolve_relative:
+                indices[negative] -= self.RELATIVE_INDEX_SHIFT
+        indices -= 1
+
+        # cada índice liga-se ao seguinte do mesmo elemento; o último volta ao primeiro
+        # nas faces e não gera aresta nas linhas
+        starts = np.cumsum(sizes) - sizes
+        last = np.cumsum(sizes) - 1
+        following = np.arange(1, len(indices) + 1)
+        following[last] = starts
+        keep = np.ones(len(indices), dtype=bool)
+        keep[last[~np.array(self._closed)]] = False
+
+        edges = np.stack([indices[keep], indices[following[keep]]], axis=1)
+        groups = np.repeat(np.array(self._element_groups, dtype=np.int64), sizes)[keep]
+
+        # descarta já aqui as arestas repetidas dentro do bloco (e do mesmo grupo)
+        _, first = np.unique(np.column_stack([groups, np.sort(edges, axis=1)]), axis=0, return_index=True)
+        first = np.sort(first)
+        return edges[first], groups[first]
+
+    def arrays(self):
+        """
+        Returns the (vertices, edges) read so far, concatenated but not validated.
+        Edge indices are absolute (0-based, counting vertex_offset).
+        """
+        self.flush()
+
+        vertices = np.concatenate(self._vertex_chunks) if self._vertex_chunks else np.empty((0, 3))
+        edges = np.concatenate(self._edge_chunks) if self._edge_chunks else np.empty((0, 2), dtype=np.int64)
+
+        return vertices, edges
+
+    def _drop_malformed_elements(self):
+        valid = np.array([token.lstrip('+-').isdigit() for token in self._index_tokens])
+        sizes = np.array(self._sizes, dtype=np.int64)
+        keep = np.logical_and.reduceat(valid, np.cumsum(sizes) - sizes)
+
+        print(f"Warning: Skipping {np.count_nonzero(~keep)} elements with non-numeric vertex indices")
+
+        token_keep = np.repeat(keep, sizes)
+        self._index_tokens = [token for token, k in zip(self._index_tokens, token_keep) if k]
+        self._sizes, self._closed, self._vertex_base, self._element_groups = (
+            [value for value, k in zip(values, keep) if k]
+            for values in (self._sizes, self._closed, self._vertex_base, self._element_groups)
+        )
+
+    def group_arrays(self):
+        """
+        Returns (names, groups): the group names in order of first appearance and
+        the group index of each edge returned by arrays().
+        """
+        self.flush()
+
+        groups = np.concatenate(self._group_chunks) if self._group_chunks else np.empty(0, dtype=np.int64)
+        return list(self._group_index), groups
+
+    def take_new_arrays(self):
+        """
+        Returns the (vertices, edges) converted since the previous call, without
+        validation (see arrays()).
+        """
+        self.flush()
+
+        vertex_start, edge_start = self._taken
+        self._taken = (len(self._vertex_chunks), len(self._edge_chunks))
+
+        new_vertices = self._vertex_chunks[vertex_start:]
+        new_edges = self._edge_chunks[edge_start:]
+        vertices = np.concatenate(new_vertices) if new_vertices else np.empty((0, 3))
+        edges = np.concatenate(new_edges) if new_edges else np.empty((0, 2), dtype=np.int64)
+
+        return vertices, edges
+
+    def finish(self):
+        """
+        Converts everything read so far into arrays.
+
+        Returns:
+            Tuple (vertices, edges, groups): see validate_edges. Edges referring to
+            missing vertices are dropped.
+        """
+        vertices, edges = self.arrays()
+        names, groups = self.group_arrays()
+        return (vertices, *self.validate_edges(edges, groups, names, len(vertices)))
+
+    @staticmethod
+    def validate_edges(edges, groups, names, vertex_count):
+        """
+        Drops out-of-range, degenerate and repeated edges (repetitions are only
+        looked for inside each group) and sorts the edges by group.
+
+        Args:
+            groups: Group index of each edge, into names.
+
+        Returns:
+            Tuple (edges, ranges): an (E, 2) int32 array and a list of
+            (name, start, end) with the edge range of each non-empty group, in
+            order of first appearance.
+        """
+        in_range = ((edges >= 0) & (edges < vertex_count)).all(axis=1)
+        if not in_range.all():
+            print(f"Warning: Skipping {np.count_nonzero(~in_range)} edges with out-of-bounds vertex indices")
+
+        keep = in_range & (edges[:, 0] != edges[:, 1])
+        edges, groups = edges[keep], groups[keep]
+
+        if len(edges):
+            _, first = np.unique(np.column_stack([groups, np.sort(edges, axis=1)]), axis=0, return_index=True)
+            first = np.sort(first)
+            edges, groups = edges[first], groups[first]
+
+        # cada grupo vira uma faixa contígua; dentro dela vale a ordem do arquivo
+        order = np.argsort(groups, kind="stable")
+        edges = edges[order].astype(np.int32)
+
+        counts = np.bincount(groups, minlength=len(names))
+        ends = np.cumsum(counts)
+        ranges = [(name, int(end - count), int(end)) for name, count, end in zip(names, counts, ends) if count]
+
+        return edges, ranges
+
+    @staticmethod
+    def _to_vertex_array(tokens):
+        """Returns (vertices, dropped): the converted rows and the sorted positions of the malformed ones."""
         try:
-            obj_type = obj.get_type()
-            vertices = obj.get_vertices()
-            color = obj.get_color()
-            is_3d = obj_type == "3DObject"
-
-            obj_data = ""
-
-            # Optional comment header
-            obj_data += f"# Object: {obj.get_name()} ({obj_type})\n"
-            if color:
-                # Convert hex color to material name if possible
-                color_name = next((name for name, hex_value in {
-                    "red": "#FF0000",
-                    "green": "#00FF00",
-                    "blue": "#0000FF",
-                    "yellow": "#FFFF00",
-                    "cyan": "#00FFFF",
-                    "magenta": "#FF00FF",
-                    "white": "#FFFFFF",
-                    "black": "#000000",
-                }.items() if hex_value.lower() == color.lower()), color)
-                
-                obj_data += f"usemtl {color_name}\n"
-
-            # Helper function to extract x, y, z coordinates from a vertex
-            # which could be a tuple or a custom Ponto3D class
-            def get_coords(vertex):
-                # Handle custom Ponto3D class (assuming it has x, y, z attributes or methods)
-                if hasattr(vertex, 'x') and hasattr(vertex, 'y'):
-                    # For a Ponto3D type object
-                    if hasattr(vertex, 'z'):
-                        return vertex.x, vertex.y, vertex.z
-                    return vertex.x, vertex.y, 0
-                elif isinstance(vertex, (list, tuple)):
-                    # For tuple/list type
-                    if len(vertex) >= 3:
-                        return vertex[0], vertex[1], vertex[2]
-                    elif len(vertex) == 2:
-                        return vertex[0], vertex[1], 0
-                # As a fallback, try string parsing
+            return np.array(tokens).astype(float).reshape(-1, 3), np.empty(0, dtype=np.int64)
+        except ValueError:
+            # conversão em lote falhou: descarta apenas os vértices malformados
+            vertices, dropped = [], []
+            for i in range(0, len(tokens), 3):
                 try:
-                    if isinstance(vertex, str):
-                        parts = vertex.strip('()').split(',')
-                        if len(parts) >= 3:
-                            return float(parts[0]), float(parts[1]), float(parts[2])
-                        else:
-                            return float(parts[0]), float(parts[1]), 0
-                except:
-                    pass
-                
-                # Last resort
-                return 0, 0, 0
-
-            # Write vertices
-            for vertex in vertices:
-                if is_3d:
-                    x, y, z = get_coords(vertex)
-                    obj_data += f"v {x} {y} {z}\n"
-                else:
-                    x, y, _ = get_coords(vertex)
-                    obj_data += f"v {x} {y}\n"
-
-            # Create lines or face depending on the type
-            if obj_type == "Line":
-                obj_data += "l 1 2\n"
-            elif obj_type == "Wireframe":
-                indices = [str(i + 1) for i in range(len(vertices))]
-                obj_data += f"f {' '.join(indices)}\n"
-            elif obj_type == "Point":
-                # Points don't have a specific representation in .obj other than vertices
-                pass
-            elif obj_type == "3DObject":
-                # For 3D objects, create faces from vertices
-                indices = [str(i + 1) for i in range(len(vertices))]
-                obj_data += f"f {' '.join(indices)}\n"
-                
-                # If there are defined segments, add them as lines too
-                if hasattr(obj, 'segments') and obj.segments:
-                    # Create a vertex lookup dictionary for more efficient matching
-                    vertex_lookup = {}
-                    
-                    # Function to compare two vertices, accounting for Ponto3D objects
-                    def vertices_equal(v1, v2):
-                        x1, y1, z1 = get_coords(v1)
-                        x2, y2, z2 = get_coords(v2)
-                        # Use approximate equality for floating point
-                        return (abs(x1 - x2) < 0.001 and 
-                                abs(y1 - y2) < 0.001 and 
-                                abs(z1 - z2) < 0.001)
-                    
-                    # Build lookup of existing vertices
-                    for i, vertex in enumerate(vertices):
-                        # We can't use the vertex as a direct key if it's a custom object
-                        # So we'll create a string representation key
-                        x, y, z = get_coords(vertex)
-                        key = f"{x:.6f},{y:.6f},{z:.6f}"
-                        vertex_lookup[key] = i + 1  # Store 1-based index
-                    
-                    # Track vertices that need to be added
-                    additional_vertices = []
-                    segment_data = []
-                    
-                    for segment in obj.segments:
-                        start_point, end_point = segment[0], segment[1]
-                        
-                        # Get coordinates and create keys
-                        start_x, start_y, start_z = get_coords(start_point)
-                        end_x, end_y, end_z = get_coords(end_point)
-                        start_key = f"{start_x:.6f},{start_y:.6f},{start_z:.6f}"
-                        end_key = f"{end_x:.6f},{end_y:.6f},{end_z:.6f}"
-                        
-                        # Try to find indices, if not found, add them to additional vertices
-                        if start_key in vertex_lookup:
-                            idx1 = vertex_lookup[start_key]
-                        else:
-                            # Add to additional vertices list and update lookup
-                            additional_vertices.append((start_x, start_y, start_z))
-                            idx1 = len(vertices) + len(additional_vertices)
-                            vertex_lookup[start_key] = idx1
-                        
-                        if end_key in vertex_lookup:
-                            idx2 = vertex_lookup[end_key]
-                        else:
-                            # Add to additional vertices list and update lookup
-                            additional_vertices.append((end_x, end_y, end_z))
-                            idx2 = len(vertices) + len(additional_vertices)
-                            vertex_lookup[end_key] = idx2
-                        
-                        segment_data.append((idx1, idx2))
-                    
-                    # Add any additional vertices needed for segments
-                    for x, y, z in additional_vertices:
-                        obj_data += f"v {x} {y} {z}\n"
-                    
-                    # Add the line segments
-                    for idx1, idx2 in segment_data:
-                        obj_data += f"l {idx1} {idx2}\n"
-            else:
-                raise ValueError(f"Unsupported object type: {obj_type}")
-
-            # Write to file
-            with open(file_path, 'w') as file:
-                file.write(obj_data)
+                    vertices.append([float(t) for t in tokens[i:i + 3]])
+                except ValueError:
+                    print(f"Warning: Skipping malformed vertex: {' '.join(tokens[i:i + 3])}")
+                    dropped.append(i // 3)
+            return np.array(vertices, dtype=float).reshape(-1, 3), np.array(dropped, dtype=np.int64)
 
-        except Exception as e:
-            print(f"Error saving .obj file: {e}")
\ No newline at end of file
+
+def _parse_obj_range(file_path, start, end, group_state):
+    """
+    Worker of ObjHandler.read_obj_parallel: parses bytes [start, end) of the file.
+    Returns (vertices, edges, names, groups), with groups indexing the local names
+    and relative indices left shifted (see ObjParser).
+    """
+    parser = ObjParser(0, *group_state, resolve_relative=False)
+
+    with open(file_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        parser.feed_text(mapped[start:end].decode('utf-8', errors='replace'))
+
+    return (*parser.arrays(), *parser.group_arrays())
@@ -18,16 +18,19 @@ class Point(AbstractGraphicalObject):
     
     def modify(self, new_coords):
         self.coordinates = new_coords
+        self.bump_geometry_version()
         return self
     
     def draw(self, canvas):
         if not self.in_window:
+            canvas.items.hide(self)
             return
 
         viewport_x, viewport_y = canvas.window_to_viewport(*self._scn_vertices[0])
         radius = 2
-        canvas.create_oval(
-            viewport_x - radius, viewport_y - radius,
-            viewport_x + radius, viewport_y + radius,
+        canvas.items.oval(
+            self,
+            (viewport_x - radius, viewport_y - radius,
+             viewport_x + radius, viewport_y + radius),
             fill=self._color, outline=""
         )
\ No newline at end of file
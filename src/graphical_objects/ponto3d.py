@@ -57,56 +57,14 @@ class Ponto3D:
     
     def translate(self, dx, dy, dz):
         """Translate the point by dx, dy, dz."""
-        matrix = np.array([
-            [1, 0, 0, dx],
-            [0, 1, 0, dy],
-            [0, 0, 1, dz],
-            [0, 0, 0, 1]
-        ], dtype=float)
-        return self._apply_transform(matrix)
+        return self._apply_transform(self.translation_matrix(dx, dy, dz))
     
     def scale(self, sx, sy=None, sz=None, origin=None):
         """
         Scale the point by sx, sy, sz factors.
         If origin is specified, scaling happens relative to that point.
         """
-        # caso scale uniforme, sx = sy = sz
-        sy = sx if sy is None else sy
-        sz = sx if sz is None else sz
-        
-        scale_matrix = np.array([
-            [sx, 0, 0, 0],
-            [0, sy, 0, 0],
-            [0, 0, sz, 0],
-            [0, 0, 0, 1]
-        ], dtype=float)
-        
-        if origin is None:
-            # escalonamento a partir da origem (0, 0, 0)
-            return self._apply_transform(scale_matrix)
-        else:
-
-            t1 = np.array([
-                [1, 0, 0, -origin.x],
-                [0, 1, 0, -origin.y],
-                [0, 0, 1, -origin.z],
-                [0, 0, 0, 1]
-            ], dtype=float)
-            
-            # 1. translacionar ponto para a origem
-            # 2. escalonar
-            # 3. translacionar de volta
-            
-            t2 = np.array([
-                [1, 0, 0, origin.x],
-                [0, 1, 0, origin.y],
-                [0, 0, 1, origin.z],
-                [0, 0, 0, 1]
-            ], dtype=float)
-            
-            # matriza de transformação composta
-            transform = t2 @ scale_matrix @ t1
-            return self._apply_transform(transform)
+        return self._apply_transform(self.scale_matrix(sx, sy, sz, origin))
     
     def rotate_x(self, angle_degrees, origin=None):
         """Rotate around the X axis by the given angle in degrees."""
@@ -134,29 +92,7 @@ class Ponto3D:
     
     def _rotate_around_origin(self, rotation_matrix, origin=None):
         """Apply rotation around a specific origin point."""
-        if origin is None:
-            # rotacionar em torno da origem (0, 0, 0)
-            return self._apply_transform(rotation_matrix)
-        else:
-
-            t1 = np.array([
-                [1, 0, 0, -origin.x],
-                [0, 1, 0, -origin.y],
-                [0, 0, 1, -origin.z],
-                [0, 0, 0, 1]
-            ], dtype=float)
-            
-            # translaciona, aplica a rotação e depois translaciona de volta
-
-            t2 = np.array([
-                [1, 0, 0, origin.x],
-                [0, 1, 0, origin.y],
-                [0, 0, 1, origin.z],
-                [0, 0, 0, 1]
-            ], dtype=float)
-            
-            transform = t2 @ rotation_matrix @ t1
-            return self._apply_transform(transform)
+        return self._apply_transform(self.around_point(rotation_matrix, origin))
     
     def rotate(self, angle_x=0, angle_y=0, angle_z=0, origin=None):
         """
@@ -164,17 +100,7 @@ class Ponto3D:
         Rotation is applied in the order: Z, Y, X.
         Angles are in degrees.
         """
-        # convertendo para radianos
-        rx, ry, rz = map(radians, (angle_x, angle_y, angle_z))
-        
-        rot_x = self.rotate_x_matrix(rx)
-        rot_y = self.rotate_y_matrix(ry)
-        rot_z = self.rotate_z_matrix(rz)
-        
-        # matriz combinada de rotação
-        combined_rotation = rot_x @ rot_y @ rot_z
-        
-        return self._rotate_around_origin(combined_rotation, origin)
+        return self._apply_transform(self.rotation_matrix(angle_x, angle_y, angle_z, origin))
     
     def transform(self, matrix):
         """Apply an arbitrary 4x4 transformation matrix to the point."""
@@ -226,4 +152,56 @@ class Ponto3D:
         ], dtype=float)
     
     def project_2d(self):
-        return (self.x, self.y)
\ No newline at end of file
+        return (self.x, self.y)
+
+    @staticmethod
+    def translation_matrix(dx, dy, dz):
+        """Return the translation matrix for a displacement of dx, dy, dz."""
+        return np.array([
+            [1, 0, 0, dx],
+            [0, 1, 0, dy],
+            [0, 0, 1, dz],
+            [0, 0, 0, 1]
+        ], dtype=float)
+    
+    @staticmethod
+    def scale_matrix(sx, sy=None, sz=None, origin=None):
+        """Return the scaling matrix for sx, sy, sz, optionally relative to origin."""
+        # caso scale uniforme, sx = sy = sz
+        sy = sx if sy is None else sy
+        sz = sx if sz is None else sz
+        
+        scale = np.array([
+            [sx, 0, 0, 0],
+            [0, sy, 0, 0],
+            [0, 0, sz, 0],
+            [0, 0, 0, 1]
+        ], dtype=float)
+        
+        return Ponto3D.around_point(scale, origin)
+    
+    @staticmethod
+    def rotation_matrix(angle_x=0, angle_y=0, angle_z=0, origin=None):
+        """Return the composite X @ Y @ Z rotation matrix for angles in degrees."""
+        # convertendo para radianos
+        rx, ry, rz = map(radians, (angle_x, angle_y, angle_z))
+        
+        # matriz combinada de rotação
+        rotation = Ponto3D.rotate_x_matrix(rx) @ Ponto3D.rotate_y_matrix(ry) @ Ponto3D.rotate_z_matrix(rz)
+        
+        return Ponto3D.around_point(rotation, origin)
+    
+    @staticmethod
+    def around_point(matrix, origin=None):
+        """Return matrix conjugated so that it is applied relative to origin."""
+        if origin is None:
+            return matrix
+        
+        # 1. translacionar para a origem
+        # 2. aplicar a transformação
+        # 3. translacionar de volta
+        t1 = Ponto3D.translation_matrix(-origin.x, -origin.y, -origin.z)
+        t2 = Ponto3D.translation_matrix(origin.x, origin.y, origin.z)
+        
+        # matriz de transformação composta
+        return t2 @ matrix @ t1
@@ -1,76 +1,180 @@
+from abc import abstractmethod
 from graphical_objects.objeto3d import Object3D
+from graphical_objects.bspline import BSplineCurve
 import numpy as np
+import math
+
+class Surface(Object3D):
+    """
+    Base das superfícies: `generate` produz a malha de curvas como buffers indexados
+    (vértices, arestas) que vão direto para Object3D.set_geometry.
+    """
+
+    # distância abaixo da qual vértices de retalhos vizinhos são considerados o mesmo
+    weld_tolerance = 1e-6
 
-class BezierSurface(Object3D):
     def __init__(self, name, id, points, color: str, fill=False):
-        coordinates = self.generate(points)
-        self.set_type("BezierSurface")
-        super().__init__(name, id, coordinates, color, fill)
-    
+        super().__init__(name, id, [], color, fill)
+        self.set_geometry(*self.generate(points))
+
+    @abstractmethod
     def generate(self, points):
+        """Retorna a tupla (vertices, edges) da malha gerada a partir dos pontos de controle."""
+        pass
+
+    @staticmethod
+    def _as_point_array(points):
+        return np.array([tuple(p) for p in points], dtype=float).reshape(-1, 3)
+
+    @staticmethod
+    def _paired_geometry(points):
+        # poucos pontos para uma superfície: liga os pontos dois a dois, como um Object3D
+        count = len(points) - len(points) % 2
+        return points[:count], np.arange(count).reshape(-1, 2)
+
+    @staticmethod
+    def grid_edges(patches, rows, columns):
+        """
+        Arestas horizontais e verticais de `patches` grades rows x columns, com os
+        vértices de cada grade numerados em sequência (patch, linha, coluna).
+
+        Returns:
+            Array (E, 2) de índices de vértices.
+        """
+        index = np.arange(patches * rows * columns).reshape(patches, rows, columns)
+
+        horizontal = np.stack([index[:, :, :-1], index[:, :, 1:]], axis=-1).reshape(-1, 2)
+        vertical = np.stack([index[:, :-1, :], index[:, 1:, :]], axis=-1).reshape(-1, 2)
+
+        return np.concatenate([horizontal, vertical])
+
+    def _grid_geometry(self, grid):
+        """
+        Retalhos que compartilham uma borda produzem os mesmos pontos nela: esses
+        vértices são soldados e as arestas repetidas são descartadas, de forma que cada
+        borda compartilhada é projetada, clipada e desenhada uma única vez.
+
+        Args:
+            grid: array (P, R, C, 3) com as amostras de cada retalho.
+
+        Returns:
+            Tupla (vertices, edges): array (V, 3) com os vértices únicos das grades e
+            array (E, 2) com as arestas horizontais e verticais sem repetição.
+        """
+        patch_count, rows, columns, _ = grid.shape
+        vertices, inverse = self._weld(grid.reshape(-1, 3), self.weld_tolerance)
+        edges = self.unique_edges(inverse[self.grid_edges(patch_count, rows, columns)])
+
+        return vertices, edges
+
+
+class BezierSurface(Surface):
+
+    # matriz de base da Bézier cúbica
+    BASIS_MATRIX = np.array([
+        [-1,  3, -3, 1],
+        [ 3, -6,  3, 0],
+        [-3,  3,  0, 0],
+        [ 1,  0,  0, 0]
+    ], dtype=float)
+
+    step = 0.05
+
+    @staticmethod
+    def _parameter_basis(step):
+        """Tabela (N, 4) com [t³ t² t 1] · M para cada amostra de t."""
+        t = np.arange(0, 1 + step, step)
+        return (t[:, None] ** np.array([3, 2, 1, 0])) @ BezierSurface.BASIS_MATRIX
+
+    def generate(self, points):
+        """
+        Avalia todos os retalhos de 16 pontos de controle de uma vez.
+
+        Returns:
+            Tupla (vertices, edges), ver Surface._grid_geometry.
+        """
+        points = self._as_point_array(points)
 
         if len(points) < 16:
-            return points
-
-        M = np.array([
-            [-1,  3, -3, 1],
-            [ 3, -6,  3, 0],
-            [-3,  3,  0, 0],
-            [ 1,  0,  0, 0]
-        ])
-        
-        Mt = M.transpose()
-        segments = []
-        step = 0.05
-        
-        # 4 em 4
-        for i in range(0, len(points) - 15, 16):
-            
-            patch_points = points[i:i+16]
-            
-            Gx = np.zeros((4, 4))
-            Gy = np.zeros((4, 4))
-            Gz = np.zeros((4, 4))
-            
-            for r in range(4):
-                for c in range(4):
-                    idx = r * 4 + c
-                    Gx[r, c] = patch_points[idx][0]  # x coordinate
-                    Gy[r, c] = patch_points[idx][1]  # y coordinate
-                    Gz[r, c] = patch_points[idx][2]  # z coordinate
-            
-            surface_points = []
-            s_values = np.arange(0, 1 + step, step)
-            
-            for s in s_values:
-                row_points = []
-                S = np.array([s**3, s**2, s, 1])
-                S_M = S @ M
-                
-                for t in np.arange(0, 1 + step, step):
-                    T = np.array([t**3, t**2, t, 1]).reshape(4, 1)
-                    Mt_T = Mt @ T
-                    
-                    x = S_M @ Gx @ Mt_T
-                    y = S_M @ Gy @ Mt_T
-                    z = S_M @ Gz @ Mt_T
-                    
-                    row_points.append((float(x), float(y), float(z)))
-                
-                surface_points.append(row_points)
-            
-            for r in range(len(surface_points)):
-                for c in range(len(surface_points[0]) - 1):
-                    # Horizontal
-                    segments.append((surface_points[r][c], surface_points[r][c+1]))
-            
-            for c in range(len(surface_points[0])):
-                for r in range(len(surface_points) - 1):
-                    # Vertical
-                    segments.append((surface_points[r][c], surface_points[r+1][c]))
-        
-        coordinates = []
-        for start, end in segments:
-            coordinates.extend([start, end])
-        
-        return coordinates
\ No newline at end of file
+            return self._paired_geometry(points)
+
+        # (P, 4, 4, 3): os pontos de controle de cada retalho, linha a linha
+        patch_count = len(points) // 16
+        control = points[:patch_count * 16].reshape(patch_count, 4, 4, 3)
+
+        # x(s, t) = S · M · G · Mᵀ · T para todas as amostras: (P, Ns, Nt, 3)
+        basis = self._parameter_basis(self.step)
+        grid = np.einsum("ai,pijd,bj->pabd", basis, control, basis)
+
+        return self._grid_geometry(grid)
+
+
+class BSplineSurface(Surface):
+    """
+    Superfície B-Spline uniforme bicúbica sobre uma grade m x n de pontos de controle
+    (m, n >= 4), avaliada por diferenças progressivas nas duas direções.
+
+    Os pontos são dados linha a linha, com `columns` pontos por linha. Sem `columns`,
+    só são aceitas quantidades com uma única grade possível (16, 25, 49, ...: quadrados
+    sem outra fatoração m x n com m, n >= 4); as demais são ambíguas e geram ValueError.
+    """
+
+    step = 0.1
+
+    def __init__(self, name, id, points, color: str, fill=False, columns=None):
+        self.columns = columns
+        super().__init__(name, id, points, color, fill)
+
+    def _grid_shape(self, count):
+        columns = self.columns
+        if columns is None:
+            shapes = [n for n in range(4, count // 4 + 1) if count % n == 0]
+            if len(shapes) != 1:
+                raise ValueError(f"informe o número de colunas: {count} pontos de controle não definem uma única grade")
+            columns = shapes[0]
+
+        if columns < 4 or count % columns != 0:
+            raise ValueError(f"{count} pontos de controle não formam uma grade com {columns} colunas")
+
+        return count // columns, columns
+
+    def generate(self, points):
+        """
+        Gera a malha de curvas de todos os retalhos 4x4 da grade de uma vez.
+
+        A tabela de diferenças de cada retalho é DD = E · M · G · Mᵀ · Eᵀ. Avançá-la na
+        direção s dá, para cada curva de s constante, a sua tabela de diferenças em t,
+        que é então avançada em t para produzir os pontos da curva.
+
+        Returns:
+            Tupla (vertices, edges), ver Surface._grid_geometry.
+        """
+        points = self._as_point_array(points)
+
+        if len(points) < 16:
+            return self._paired_geometry(points)
+
+        rows, columns = self._grid_shape(len(points))
+        if rows < 4 or columns < 4:
+            raise ValueError("a superfície B-Spline precisa de uma grade de pelo menos 4x4 pontos de controle")
+
+        # (P, 4, 4, 3): janelas 4x4 deslizantes sobre a grade de controle
+        net = points.reshape(rows, columns, 3)
+        r = np.arange(rows - 3)[:, None, None, None] + np.arange(4)[None, None, :, None]
+        k = np.arange(columns - 3)[None, :, None, None] + np.arange(4)[None, None, None, :]
+        control = net[r, k].reshape(-1, 4, 4, 3)
+
+        M = BSplineCurve.BASIS_MATRIX
+        E = BSplineCurve.forward_difference_matrix(self.step)
+        table = np.einsum("ai,ij,pjkd,lk,bl->pabd", E, M, control, M, E)
+
+        # inclui t = 1 para fechar a borda de cada retalho; as bordas compartilhadas são soldadas
+        samples = math.ceil(1 / self.step) + 1
+
+        # avança em s: (P, Ns, 4, 3) tabelas em t das curvas de s constante
+        curves = BSplineCurve.forward_differences(table, samples)
+
+        # avança em t: (P * Ns, Nt, 3)
+        grid = BSplineCurve.forward_differences(curves.reshape(-1, 4, 3), samples)
+
+        return self._grid_geometry(grid.reshape(len(control), samples, samples, 3))
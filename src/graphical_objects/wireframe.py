@@ -1,5 +1,6 @@
 #todo
 from graphical_objects.abstract_graphical_object import AbstractGraphicalObject
+import numpy as np
 
 class Wireframe(AbstractGraphicalObject):
     def __init__(self, name, id, coordinates: list[tuple[str, str]], color: str, fill: bool):
@@ -27,34 +28,33 @@ class Wireframe(AbstractGraphicalObject):
     
     def modify(self, new_coords):
         self.coordinates = new_coords
+        self.bump_geometry_version()
         return self
     
     def draw(self, canvas):
         if not self.in_window:
+            canvas.items.hide(self)
             return
         
         #print("Wireframe draw method called")
 
         #print("Wireframe scn vertices: " , self._scn_vertices)
 
-        viewport_coords = [
-            canvas.window_to_viewport(*vertex)
-            for vertex in self._scn_vertices
-        ]
+        viewport_coords = canvas.window_to_viewport_array(self._clipped_vertices)
 
         #print("Wireframe viewport coords: ", viewport_coords)
 
         if self._fill:
 
-            flat_coords = [coord for pair in viewport_coords for coord in pair]
-            canvas.create_polygon(
+            flat_coords = viewport_coords.reshape(-1).tolist()
+            canvas.items.polygon(
+                self,
                 flat_coords,
                 fill=self._color,
                 outline=self._color
             )
         else:
 
-            for i in range(len(viewport_coords) - 1):
-                x0, y0 = viewport_coords[i]
-                x1, y1 = viewport_coords[i + 1]
-                canvas.create_line(x0, y0, x1, y1, fill=self._color)
\ No newline at end of file
+            # cada linha liga o vértice i ao i + 1: (N - 1, 4)
+            lines = np.hstack([viewport_coords[:-1], viewport_coords[1:]])
+            canvas.items.lines(self, lines.tolist(), fill=self._color)
\ No newline at end of file
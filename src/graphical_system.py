@@ -3,22 +3,33 @@ from user_interface import UserInterface
 from viewport import Viewport
 from graphical_objects.graphical_object_factory import GraphicalObjectFactory
 from file_loader import FileLoader
-from graphical_objects.objhandler import ObjHandler
+from graphical_objects.objhandler import ObjHandler, ObjImportCancelled
+from graphical_objects.obj_cache import ObjGeometryCache
+from graphical_objects.mesh_io import StlHandler, PlyHandler
+from graphical_objects.objeto3d import Object3D
 from clipper import Clipper
+from import_task import ImportTask, PartialGeometry
 
+import os
 import utils as ut
 import constants as c
 
 
 class GraphicalSystem:
-    def __init__(self):
+    def __init__(self, render_backend=c.RENDER_BACKEND):
         self._ui = UserInterface(self)
         self._file_loader = FileLoader(self)
-        self._viewport = Viewport(self, self._ui, width=c.VIEWPORT_WIDTH, height=c.VIEWPORT_HEIGHT, bg=c.VIEWPORT_BG_COLOR)
+        self._viewport = Viewport(self, self._ui, backend=render_backend, width=c.VIEWPORT_WIDTH, height=c.VIEWPORT_HEIGHT, bg=c.VIEWPORT_BG_COLOR)
         self._ui.set_viewport(self._viewport)
         self._unique_id = 0
         self._clipper = Clipper()
         self._3dperspective = c.PARALLEL_PROJECTION
+        self._obj_cache = ObjGeometryCache() if c.OBJ_CACHE_ENABLED else None
+
+        # importação em segundo plano em andamento (uma por vez)
+        self._import_task = None
+        self._import_preview = None
+        self._import_geometry = None
     
     def run(self):
         self._ui.run()
@@ -37,6 +48,7 @@ class GraphicalSystem:
         fill = options.get("fill", False)
         curve_type = options.get("curve_type", None)
         surface_type = options.get("surface_type", None)
+        columns = options.get("columns", None)
 
         if curve_type is None and obj_type == "Curve":
             self._ui.display_error("Tipo de curva não especificado")
@@ -53,6 +65,16 @@ class GraphicalSystem:
             self._ui.display_error(str(e))
             return
 
+        # número de colunas da grade de controle (opcional, só para B-Spline)
+        if columns is not None and str(columns).strip() != "":
+            try:
+                columns = int(columns)
+            except ValueError:
+                self._ui.display_error(f"Número de colunas inválido: {columns}")
+                return
+        else:
+            columns = None
+
         # instancia objeto utilizando factory com parâmetros em um dicionário
         params = {
             "object_type": obj_type,
@@ -62,10 +84,15 @@ class GraphicalSystem:
             "color": color,
             "fill": fill,
             "curve_type": curve_type,
-            "surface_type": surface_type
+            "surface_type": surface_type,
+            "columns": columns
         }
 
-        obj = GraphicalObjectFactory.create_object(**params)
+        try:
+            obj = GraphicalObjectFactory.create_object(**params)
+        except ValueError as e:
+            self._ui.display_error(str(e))
+            return
         self._unique_id += 1
 
 
@@ -78,6 +105,34 @@ class GraphicalSystem:
         #exibe mensagem de sucesso e adiciona objeto à lista de referências da UI
         self.reference_object(obj)
 
+    def create_object_from_arrays(self, name: str, vertices, edges, color: str, faces=None):
+        """Cria um Object3D diretamente a partir de buffers de vértices (V, 3) e arestas (E, 2)."""
+        obj = Object3D.from_arrays(name, self._unique_id, vertices, edges, color, faces=faces)
+        self._unique_id += 1
+
+        self._viewport.display_file.add_object(obj)
+        self._viewport.update()
+
+        self.reference_object(obj)
+        return obj
+
+    def create_objects_from_groups(self, vertices, edges, groups, color: str):
+        """
+        Cria um Object3D por grupo ('o'/'g' de um .obj). Todos usam fatias do mesmo
+        buffer de vértices; groups é uma lista de (nome, início, fim) em edges.
+        """
+        objects = []
+        for name, start, end in groups:
+            obj = Object3D.from_shared_buffer(name, self._unique_id, vertices, edges[start:end], color)
+            self._unique_id += 1
+            objects.append(obj)
+
+        self._viewport.display_file.add_objects(objects)
+        self._viewport.update()
+
+        self._ui.display_info(f"{len(objects)} objects imported")
+        return objects
+
     def translate_object(self, obj_id: str, shift: list[tuple[float, float]]):
 
         obj = self._viewport.display_file.get_object_by_id(int(obj_id))
@@ -184,8 +239,6 @@ class GraphicalSystem:
                 self.rotate_object(obj_id, value, point)
             else:
                 self.rotate_object(obj_id, value)
-
-        self._viewport.update()
     
     def reference_object(self, obj, message=None):
         if message != None:
@@ -195,17 +248,157 @@ class GraphicalSystem:
     
     def import_object(self):
         file_path = self._file_loader.open_file_dialog()
-        if file_path:
+        if not file_path:
+            return
+
+        if self._import_task is not None:
+            self._ui.display_error("An import is already running")
+            return
+
+        # a leitura roda em uma thread; a geometria chega pela fila da tarefa
+        task = ImportTask(file_path, self._read_model, cancelled_errors=(ObjImportCancelled,))
+        self._import_task = task
+        self._import_preview = None
+        self._import_geometry = PartialGeometry()
+
+        self._ui.show_import_progress(os.path.basename(file_path), task.cancel)
+        task.start()
+        self._ui.after(c.IMPORT_POLL_INTERVAL, self._poll_import)
+
+    @staticmethod
+    def _model_name(file_path):
+        extension = os.path.splitext(file_path)[1].lower()
+        return {".stl": "LoadedStlModel", ".ply": "LoadedPlyModel"}.get(extension, "LoadedObjModel")
+
+    def _read_model(self, task):
+        """Executado na thread da importação: lê o arquivo e retorna (vertices, edges, faces, groups)."""
+        file_path = task.file_path
+        extension = os.path.splitext(file_path)[1].lower()
+
+        # STL e PLY binários são mapeados direto do disco; o resto é tratado como .obj
+        if extension == ".stl":
+            return (*StlHandler.read_stl(file_path), None)
+        if extension == ".ply":
+            return (*PlyHandler.read_ply(file_path), None)
+
+        vertices, edges, groups = self.read_obj_geometry(file_path, progress=task.progress, cancel=task.cancelled, batch=task.batch)
+        return vertices, edges, None, groups
+
+    def _poll_import(self):
+        task = self._import_task
+        received_batch = False
+
+        for message in task.poll():
+            kind = message[0]
+
+            if kind == "progress":
+                self._ui.update_import_progress(message[1])
+
+            elif kind == "batch":
+                self._import_geometry.append(message[1], message[2])
+                received_batch = True
+
+            else:
+                self._finish_import(task, message)
+                return
+
+        # apagar o modelo parcial pela lista de objetos equivale a cancelar a importação
+        preview = self._import_preview
+        if preview is not None and preview not in self._viewport.display_file:
+            task.cancel()
+
+        # redesenha uma vez por leitura da fila, com tudo o que chegou desde a anterior
+        if received_batch and not task.cancelled():
+            self._update_import_preview(task)
+
+        self._ui.after(c.IMPORT_POLL_INTERVAL, self._poll_import)
+
+    def _update_import_preview(self, task):
+        vertices, edges = self._import_geometry.arrays()
+
+        if self._import_preview is None:
+            # o modelo parcial entra na display file já com o id definitivo
+            self._import_preview = Object3D.from_arrays(self._model_name(task.file_path), self._unique_id, vertices, edges, "blue")
+            self._unique_id += 1
+            self._viewport.display_file.add_object(self._import_preview)
+        else:
+            self._import_preview.set_geometry(vertices, edges)
+
+        self._viewport.update()
+
+    def _finish_import(self, task, message):
+        kind = message[0]
+        preview = self._import_preview
+
+        # o modelo parcial pode ter sido apagado no mesmo intervalo em que a leitura terminou
+        if preview is not None and preview not in self._viewport.display_file:
+            kind = "cancelled"
+
+        self._import_task = None
+        self._import_preview = None
+        self._import_geometry = None
+        self._ui.hide_import_progress()
+
+        if kind == "done":
+            vertices, edges, faces, groups = message[1]
+            if len(edges) == 0:
+                self._discard_import_preview(preview)
+                self._ui.display_error("Error loading object: no edges found")
+                return
+
+            # .obj com vários grupos: um objeto por grupo no lugar do modelo parcial
+            if groups is not None and len(groups) > 1:
+                self._discard_import_preview(preview)
+                self.create_objects_from_groups(vertices, edges, groups, "blue")
+                return
+
+            if preview is None:
+                self.create_object_from_arrays(self._model_name(task.file_path), vertices, edges, "blue", faces)
+                return
+
+            # a geometria final (validada e sem arestas repetidas) substitui a parcial
+            preview.set_geometry(vertices, edges, faces)
+            self._viewport.update()
+            self.reference_object(preview)
+            return
+
+        self._discard_import_preview(preview)
+
+        if kind == "cancelled":
+            self._ui.log_message(f"Import of {os.path.basename(task.file_path)} cancelled")
+        elif isinstance(message[1], FileNotFoundError):
+            self._ui.display_error("Error loading object: File not found or empty")
+        else:
+            self._ui.display_error(f"Error loading object: {str(message[1])}")
+
+    def _discard_import_preview(self, preview):
+        if preview is not None:
+            self._viewport.display_file.remove_object(preview)
+            self._viewport.update()
+
+    def read_obj_geometry(self, file_path, progress=None, cancel=None, batch=None):
+        """
+        Lê (vertices, edges, groups) de um .obj, do cache binário quando possível.
+        batch recebe a geometria parcial de cada bloco (só na leitura sequencial).
+        """
+        if self._obj_cache is not None:
+            cached = self._obj_cache.get(file_path)
+            if cached is not None:
+                return cached
+
+        # lê o arquivo em uma única passada, direto para arrays
+        if c.OBJ_PARALLEL_IMPORT:
+            vertices, edges, groups = ObjHandler.read_obj_parallel(file_path, progress=progress, cancel=cancel)
+        else:
+            vertices, edges, groups = ObjHandler.read_obj(file_path, progress=progress, cancel=cancel, batch=batch)
+
+        if self._obj_cache is not None:
             try:
-                # carrega string
-                obj_as_string = ObjHandler.load_obj(file_path)
-                if obj_as_string is None:
-                    self._ui.display_error("Error loading object: File not found or empty")
-                    return
-                # processa string e cria objetos
-                ObjHandler.process_obj_data(obj_as_string, self)
-            except Exception as e:
-                self._ui.display_error(f"Error loading object: {str(e)}")
+                self._obj_cache.put(file_path, vertices, edges, groups)
+            except OSError as e:
+                print(f"Warning: could not cache {file_path}: {e}")
+
+        return vertices, edges, groups
 
     def export_object(self, obj_id: str):
         file_path = self._file_loader.save_file_dialog()
@@ -214,12 +407,37 @@ class GraphicalSystem:
                 if self._viewport.display_file.get_object_by_id(int(obj_id)) is None:
                     self._ui.display_error(f"Object with id {obj_id} not found")
                     return
-                # salva o objeto em um arquivo .obj
-                ObjHandler.save_obj(file_path, self._viewport.display_file.get_object_by_id(int(obj_id)))
+                obj = self._viewport.display_file.get_object_by_id(int(obj_id))
+                extension = os.path.splitext(file_path)[1].lower()
+
+                # o formato segue a extensão escolhida; .obj é o padrão
+                if extension in (".stl", ".ply"):
+                    if obj.get_type() != "3DObject":
+                        self._ui.display_error(f"Only 3D objects can be exported as {extension}")
+                        return
+                    save = StlHandler.save_stl if extension == ".stl" else PlyHandler.save_ply
+                    save(file_path, obj)
+                else:
+                    ObjHandler.save_obj(file_path, obj)
                 self._ui.display_info(f"Object saved to {file_path}")
             except Exception as e:
                 self._ui.display_error(f"Error saving object: {str(e)}")
 
+    def export_all_objects(self):
+        objects = self._viewport.display_file.get_objects()
+        if not objects:
+            self._ui.display_error("No objects to export")
+            return
+
+        file_path = self._file_loader.save_file_dialog()
+        if file_path:
+            try:
+                # todos os objetos em um único arquivo, um grupo 'o' por objeto
+                ObjHandler.save_objects(file_path, objects)
+                self._ui.display_info(f"{len(objects)} objects saved to {file_path}")
+            except Exception as e:
+                self._ui.display_error(f"Error saving objects: {str(e)}")
+
     def clip_objects(self):
         self._clipper.clip(self._viewport.display_file.get_objects(), self._viewport)
 
@@ -0,0 +1,113 @@
+import queue
+import threading
+import numpy as np
+
+
+class ImportTask:
+    """
+    Executa a leitura de um modelo em uma thread de trabalho, sem bloquear o Tk.
+
+    A thread nunca toca em widgets: tudo o que ela produz vai para a fila `messages`,
+    que o laço principal esvazia periodicamente com after(). As mensagens são tuplas:
+
+    - ("progress", fração): parte do arquivo já lida (0 a 1);
+    - ("batch", vertices, edges): geometria parcial, para exibição progressiva;
+    - ("done", resultado): valor retornado por target;
+    - ("cancelled",): a leitura foi interrompida por cancel();
+    - ("error", exceção): a leitura falhou.
+
+    Args:
+        file_path: arquivo a importar.
+        target: função chamada na thread como target(task); recebe a própria tarefa
+                para ler file_path, publicar progresso (progress, batch) e consultar
+                cancelled.
+        cancelled_errors: exceções que indicam cancelamento, e não falha.
+    """
+
+    def __init__(self, file_path, target, cancelled_errors=()):
+        self.file_path = file_path
+        self.messages = queue.Queue()
+        self._target = target
+        self._cancelled_errors = cancelled_errors
+        self._cancel = threading.Event()
+        # daemon: fechar a janela no meio de uma importação não espera a thread
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def progress(self, fraction):
+        self.messages.put(("progress", fraction))
+
+    def batch(self, vertices, edges):
+        if len(vertices) or len(edges):
+            self.messages.put(("batch", vertices, edges))
+
+    def _run(self):
+        try:
+            result = self._target(self)
+        except self._cancelled_errors:
+            self.messages.put(("cancelled",))
+        except Exception as e:
+            self.messages.put(("error", e))
+        else:
+            if self.cancelled():
+                self.messages.put(("cancelled",))
+            else:
+                self.messages.put(("done", result))
+
+    def poll(self):
+        """Retorna todas as mensagens já publicadas, sem bloquear."""
+        messages = []
+        while True:
+            try:
+                messages.append(self.messages.get_nowait())
+            except queue.Empty:
+                return messages
+
+
+class PartialGeometry:
+    """
+    Acumula os lotes ("batch") de uma importação para o modelo parcial.
+
+    Os buffers crescem por duplicação, então cada lote custa proporcionalmente ao seu
+    tamanho e não ao que já foi lido. Arestas que apontam para vértices ainda não
+    recebidos ficam pendentes até que eles cheguem.
+    """
+
+    def __init__(self):
+        self._vertices = np.empty((0, 3))
+        self._edges = np.empty((0, 2), dtype=np.int32)
+        self._vertex_count = 0
+        self._edge_count = 0
+        self._pending = np.empty((0, 2), dtype=np.int64)
+
+    @staticmethod
+    def _append(buffer, count, rows):
+        if count + len(rows) > len(buffer):
+            grown = np.empty((max(2 * len(buffer), count + len(rows)), buffer.shape[1]), dtype=buffer.dtype)
+            grown[:count] = buffer[:count]
+            buffer = grown
+        buffer[count:count + len(rows)] = rows
+        return buffer, count + len(rows)
+
+    def append(self, vertices, edges):
+        self._vertices, self._vertex_count = self._append(self._vertices, self._vertex_count, vertices)
+
+        edges = np.concatenate([self._pending, edges])
+        # índices negativos nunca serão válidos; os demais esperam pelos seus vértices
+        valid = (edges >= 0).all(axis=1)
+        ready = valid & (edges < self._vertex_count).all(axis=1)
+        self._pending = edges[valid & ~ready]
+
+        self._edges, self._edge_count = self._append(self._edges, self._edge_count, edges[ready])
+
+    def arrays(self):
+        """(vertices, edges) recebidos até agora, como vistas dos buffers."""
+        return self._vertices[:self._vertex_count], self._edges[:self._edge_count]
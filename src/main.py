@@ -1,4 +1,10 @@
+import argparse
+import constants as c
 from graphical_system import GraphicalSystem
 if __name__ == "__main__":
-    GS = GraphicalSystem()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", choices=[c.RENDER_BACKEND_CANVAS, c.RENDER_BACKEND_FRAMEBUFFER], default=c.RENDER_BACKEND)
+    args = parser.parse_args()
+
+    GS = GraphicalSystem(render_backend=args.backend)
     GS.run()
\ No newline at end of file
@@ -7,39 +7,44 @@ import math
 
 class Renderer:
     def __init__(self, viewport, application):
-        self._3dperspective = c.PERSPECTIVE_PROJECTION
         self._viewport = viewport
         self._application = application
 
-        self._cop = Ponto3D(0, 0, -800)
+        # as matrizes ficam em cache na câmera e só são reconstruídas quando ela muda
+        self._camera = viewport.camera
+        self._camera.set_matrix_builder(self._build_matrices)
 
+        self._view_matrix = None
         self._projection_matrix = None
 
-        self._focal_distance = 500
-
         self._near_plane = 10.0
         self._far_plane = 5000.0
 
+    @property
+    def _3dperspective(self):
+        return self._camera.projection
+
+    @_3dperspective.setter
+    def _3dperspective(self, projection):
+        self._camera.projection = projection
+
     def recompute(self):
 
-        print("Starting recompute...")
+        self._view_matrix, self._projection_matrix = self._camera.get_matrices()
 
-        cop_translation = self.translation_matrix(-self._cop.x, -self._cop.y, -self._cop.z)
+    def _build_matrices(self, camera):
 
-        print(f"Current camera location: {self._cop}")
+        cop_translation = self.translation_matrix(-camera.cop[0], -camera.cop[1], -camera.cop[2])
         
-        pitch, yaw, roll = self.extract_angles_from_vector(self._viewport.vpn, self._viewport.vup)
+        pitch, yaw, roll = self.extract_angles_from_vector(camera.vpn, camera.vup)
 
         # para os casos de yaw = 90 e yaw = 270, pode ser que o método acima retorne 0. verificar
         # tais edge cases
-        if abs(self._viewport.vpn[2]) < 0.001 and abs(self._viewport.vpn[0]) > 0.9:
-            if self._viewport.vpn[0] > 0:
+        if abs(camera.vpn[2]) < 0.001 and abs(camera.vpn[0]) > 0.9:
+            if camera.vpn[0] > 0:
                 yaw = math.pi/2
             else:
                 yaw = 3*math.pi/2
-            print(f"Edge case detected! Setting yaw to {math.degrees(yaw):.2f} degrees")
-
-        print(f"Pitch: {np.degrees(pitch)}, Yaw: {np.degrees(yaw)}, Roll: {np.degrees(roll)}")
         
         rotate_x = Ponto3D.rotate_x_matrix(pitch)
         rotate_y = Ponto3D.rotate_y_matrix(yaw)
@@ -47,62 +52,124 @@ class Renderer:
         
         aligned = rotate_z @ rotate_y @ rotate_x
 
-        perspective = self.perspective_matrix(self._focal_distance)
+        perspective = self.perspective_matrix(camera.focal_distance)
 
-        print(f"Aligned Matrix: \n{aligned}")
+        view_matrix = aligned @ cop_translation
 
-        print(f"Translation Matrix: \n{cop_translation}")
+        projection_matrix = perspective @ view_matrix
 
-        self._view_matrix = aligned @ cop_translation
+        return view_matrix, projection_matrix
 
-        self._projection_matrix = perspective @ (self._view_matrix)
+    def render_3d_object(self, object):
 
-        print(f"Perspective Matrix: \n{self.perspective_matrix(self._focal_distance)}")
-        print(f"Projection Matrix: \n{self._projection_matrix}")	
+        obj = cast(Object3D, object)
 
-    def render_3d_object(self, object):
+        normalized, visible = self.project_object3d(obj)
 
-        vpn = self._viewport.vpn / np.linalg.norm(self._viewport.vpn)
-        theta_x = np.arctan2(vpn[1], vpn[2])
-        theta_y = np.arctan2(vpn[0], vpn[2])
+        # segmentos totalmente fora de [near, far] são descartados; os que cruzam os planos já vêm clipados
+        obj.set_normalized_segments(normalized[visible])
 
-        obj = cast(Object3D, object)
-            
-        segments = []
+    def project_object3d(self, obj):
+        """
+        Projeta todos os segmentos de um Object3D de uma só vez.
 
-        for segment in obj.segments:
+        Returns:
+            Tupla (normalized, visible): array (E, 2, 2) com as coordenadas
+            normalizadas de window de cada extremidade e máscara booleana (E,)
+            indicando os segmentos que têm alguma parte entre os planos near e far.
+        """
+        segments = obj.get_segment_array()
+
+        if self._3dperspective == c.PARALLEL_PROJECTION:
+            vpn = self._viewport.vpn / np.linalg.norm(self._viewport.vpn)
+            theta_x = np.arctan2(vpn[1], vpn[2])
+            theta_y = np.arctan2(vpn[0], vpn[2])
+            points_2d = self._project_parallel_array(segments.reshape(-1, 3), theta_x, theta_y)
+            points_2d = self.align_z_axis(points_2d)
+            visible = np.ones(len(segments), dtype=bool)
+
+        elif self._3dperspective == c.PERSPECTIVE_PROJECTION:
+            points_2d, visible = self._project_perspective_segments(segments)
+        else:
+            raise ValueError("Invalid projection type")
 
-            updated_segment = []
+        normalized = self.normalize_vertices(points_2d).reshape(-1, 2, 2)
 
-            clipped_segment = False
+        return normalized, visible
 
-            for point in segment:
+    def _project_parallel_array(self, points, theta_x, theta_y):
 
-                if self._3dperspective == c.PARALLEL_PROJECTION:
-                    point_2d = self._render_parallel_projection(point, theta_x, theta_y)
+        # mesma sequência de _render_parallel_projection, composta em uma única matriz
+        transform = (Ponto3D.rotate_y_matrix(-theta_y)
+                     @ Ponto3D.rotate_x_matrix(-theta_x)
+                     @ self.translation_matrix(-self._viewport.vrp[0], -self._viewport.vrp[1], -self._viewport.vrp[2]))
 
-                elif self._3dperspective == c.PERSPECTIVE_PROJECTION:
-                    point_2d = self._render_perspective_projection(point)
-                else:
-                    raise ValueError("Invalid projection type")
-                
-                if point_2d is None:
-                    clipped_segment = True
-                    break
+        homogeneous = self._to_homogeneous_array(points)
 
-                updated_segment.append(point_2d)
-            
-            if clipped_segment:
-                print("Segment clipped, skipping...")
-                continue
+        transformed = homogeneous @ transform.T
+
+        return transformed[:, :2]
+
+    def _project_perspective_segments(self, segments):
+
+        homogeneous = self._to_homogeneous_array(segments).reshape(-1, 2, 4)
+
+        # clipping contra near/far no espaço da câmera, antes da divisão perspectiva
+        camera_segments = homogeneous @ self._view_matrix.T
+        camera_segments, visible = self.clip_near_far(camera_segments)
 
-            # consertar para a outra tbm
-            if self._3dperspective == c.PARALLEL_PROJECTION:
-                updated_segment = self.align_z_axis(updated_segment)
+        # projection_matrix = perspective @ view, então basta aplicar a perspectiva
+        perspective = self.perspective_matrix(self._camera.focal_distance)
+        clipped_points = camera_segments.reshape(-1, 4) @ perspective.T
 
-            segments.append(self.normalize_vertices(updated_segment))
+        # segmentos descartados podem ter w = 0; seu resultado é ignorado pela máscara
+        with np.errstate(divide="ignore", invalid="ignore"):
+            points_2d = clipped_points[:, :2] / clipped_points[:, 3:4]
 
-        obj.set_normalized_segments(segments)
+        return points_2d, visible
+
+    def clip_near_far(self, camera_segments):
+        """
+        Clipa segmentos em coordenadas homogêneas da câmera contra os planos near e far.
+
+        Args:
+            camera_segments: array (E, 2, 4) com as extremidades já transformadas pela view matrix.
+
+        Returns:
+            Tupla (clipped, visible): array (E, 2, 4) em que as extremidades fora do
+            volume foram movidas para o plano cruzado, e máscara booleana (E,) dos
+            segmentos com alguma parte dentro do volume.
+        """
+        start = camera_segments[:, 0].copy()
+        end = camera_segments[:, 1].copy()
+        visible = np.ones(len(camera_segments), dtype=bool)
+
+        # distância com sinal a cada plano; positiva do lado de dentro
+        planes = (
+            lambda p: p[:, 2] - self._near_plane * p[:, 3],
+            lambda p: self._far_plane * p[:, 3] - p[:, 2],
+        )
+
+        for distance in planes:
+            d0, d1 = distance(start), distance(end)
+            visible &= ~((d0 < 0) & (d1 < 0))
+
+            # segmentos paralelos ao plano geram t inválido, mas nunca são clipados por ele
+            with np.errstate(divide="ignore", invalid="ignore"):
+                t = d0 / (d0 - d1)
+                intersection = start + t[:, None] * (end - start)
+
+            clip_start = visible & (d0 < 0)
+            clip_end = visible & (d1 < 0)
+            start[clip_start] = intersection[clip_start]
+            end[clip_end] = intersection[clip_end]
+
+        return np.stack([start, end], axis=1), visible
+
+    @staticmethod
+    def _to_homogeneous_array(points):
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        return np.hstack([points, np.ones((len(points), 1))])
 
     def _render_parallel_projection(self, point, theta_x, theta_y):
 
@@ -153,47 +220,34 @@ class Renderer:
         x_min, y_min = self._viewport.window_bounds[0]
         x_max, y_max = self._viewport.window_bounds[1]
 
-        cx = (x_min + x_max) / 2
-        cy = (y_min + y_max) / 2
-
-        # faz a translação do mundo (nesse caso, 1 objeto) para o centro da window
-        translated = [(x - cx, y - cy) for x, y in vertices]
+        center = np.array([(x_min + x_max) / 2, (y_min + y_max) / 2])
 
         # o ângulo de rotação é o ângulo entre a VUP e o eixo Y do mundo
         vx, vy, vz = self._viewport.vup
         angle = -np.arctan2(vx, vy)
 
         cos_a, sin_a = np.cos(angle), np.sin(angle)
+        rotation = np.array([[cos_a, -sin_a],
+                             [sin_a, cos_a]])
 
-        # rotaciona o mundo por -θ para alinhar o VUP com o eixo Y
-        rotated = [
-            (x * cos_a - y * sin_a, x * sin_a + y * cos_a)
-            for x, y in translated
-        ]
-
-        translated_back = [
-            (x + cx, y + cy)
-            for x, y in rotated
-        ]
+        # translada para o centro da window, rotaciona por -θ para alinhar o VUP com o eixo Y
+        # e translada de volta
+        translated = np.asarray(vertices, dtype=float).reshape(-1, 2) - center
 
-        return translated_back
+        return translated @ rotation.T + center
 
     def normalize_vertices(self, vertices):
         x_min, y_min = self._viewport.window_bounds[0][:2]
         x_max, y_max = self._viewport.window_bounds[1][:2]
 
-        window_width, window_height = x_max - x_min, y_max - y_min
+        window_min = np.array([x_min, y_min], dtype=float)
+        window_size = np.array([x_max - x_min, y_max - y_min], dtype=float)
 
-        normalized_vertices = [
-            ((x - x_min) / window_width, (y - y_min) / window_height)
-            for x, y in vertices
-        ]
-
-        return normalized_vertices
+        return (np.asarray(vertices, dtype=float).reshape(-1, 2) - window_min) / window_size
     
     def translate_cop(self, dx, dy, dz):
 
-        self._cop.translate(dx, dy, dz)
+        self._camera.cop = self._camera.cop + np.array([dx, dy, dz], dtype=float)
 
         self.recompute()
 
@@ -201,9 +255,6 @@ class Renderer:
     # "Write a function to extract pitch, yaw, and roll angles from a view direction vector (vpn) and an up vector (vup)."
     def extract_angles_from_vector(self, vpn_tuple, vup_tuple):
 
-        print("VPN:", vpn_tuple)
-        print("VUP:", vup_tuple)
-
         """
         Extracts pitch, yaw, and roll angles from a view direction vector (vpn)
         and an up vector (vup).
@@ -364,10 +415,10 @@ class Renderer:
         return pitch, yaw, roll
     
     def switch_focal_distance(self):
-        if self._focal_distance == 500:
-            self._focal_distance = 100
+        if self._camera.focal_distance == c.DEFAULT_FOCAL_DISTANCE:
+            self._camera.focal_distance = c.SHORT_FOCAL_DISTANCE
         else:
-            self._focal_distance = 500
+            self._camera.focal_distance = c.DEFAULT_FOCAL_DISTANCE
     
     @staticmethod
     def perspective_matrix(focal_distance):
@@ -412,6 +463,4 @@ class Renderer:
         
         print("world displacement: ")
 
-        self._cop.x += displacement_world[0]
-        self._cop.y += displacement_world[1]
-        self._cop.z += displacement_world[2]
\ No newline at end of file
+        self._camera.cop = self._camera.cop + displacement_world
\ No newline at end of file
@@ -1,4 +1,5 @@
 import tkinter as tk
+from tkinter import ttk
 import constants as c
 from object_manager_ui import ObjectManagerUI
 from file_loader import FileLoader
@@ -79,8 +80,12 @@ class UserInterface(tk.Tk):
         tk.Button(zoom_frame, command=self.zoom_out, text="Zoom out").pack(side=tk.LEFT, padx=5)
         import_button = tk.Button(self, text="Import OBJ", command=self._app.import_object)
         export_button = tk.Button(self, text="Export OBJ", command=self.export)
-        import_button.place(relx=1.0, rely=1.0, anchor="se", x=-140, y=-10)
-        export_button.place(relx=1.0, rely=1.0, anchor="se", x=-10, y=-10)
+        export_all_button = tk.Button(self, text="Export All", command=self._app.export_all_objects)
+        import_button.place(relx=1.0, rely=1.0, anchor="se", x=-240, y=-10)
+        export_button.place(relx=1.0, rely=1.0, anchor="se", x=-110, y=-10)
+        export_all_button.place(relx=1.0, rely=1.0, anchor="se", x=-10, y=-10)
+
+        self.import_progress_frame = None
             
     def rotate_window_popup(self):
 
@@ -179,6 +184,7 @@ class UserInterface(tk.Tk):
         surface_frame = tk.Frame(popup)
         surface_type_var = tk.StringVar(popup)
         surface_type_var.set(c.AVAILABLE_SURFACES[0])
+        columns_var = tk.StringVar(popup)
 
         def update_ui_options(*args):
             fill_frame.pack_forget()
@@ -200,6 +206,8 @@ class UserInterface(tk.Tk):
                 tk.Label(surface_frame, text="Surface Type:").pack(side=tk.LEFT, padx=5)
                 surface_menu = tk.OptionMenu(surface_frame, surface_type_var, *c.AVAILABLE_SURFACES)
                 surface_menu.pack(side=tk.LEFT, padx=5)
+                tk.Label(surface_frame, text="Columns (B-Spline):").pack(side=tk.LEFT, padx=5)
+                tk.Entry(surface_frame, textvariable=columns_var, width=5).pack(side=tk.LEFT, padx=5)
 
         obj_type_var.trace_add("write", update_ui_options)
         update_ui_options()
@@ -217,6 +225,7 @@ class UserInterface(tk.Tk):
                 options["curve_type"] = curve_type_var.get()
             elif obj_type.lower() == "surface":
                 options["surface_type"] = surface_type_var.get()
+                options["columns"] = columns_var.get()
 
             self._app.create_object(obj_type, coords, name, color, **options)
             popup.destroy()
@@ -224,6 +233,35 @@ class UserInterface(tk.Tk):
         tk.Button(popup, text="Create", command=create_object).pack(pady=10)
 
     
+    def show_import_progress(self, file_name, on_cancel):
+        """Mostra, acima dos botões de importação, o progresso da leitura com um botão de cancelar."""
+        self.hide_import_progress()
+
+        frame = tk.Frame(self, bg="gray")
+        tk.Label(frame, text=f"Importing {file_name}", bg="gray").pack(side=tk.LEFT, padx=5)
+        self.import_progress_bar = ttk.Progressbar(frame, length=160, maximum=1.0, mode="determinate")
+        self.import_progress_bar.pack(side=tk.LEFT, padx=5)
+
+        def cancel():
+            on_cancel()
+            cancel_button.config(state=tk.DISABLED, text="Cancelling...")
+
+        cancel_button = tk.Button(frame, text="Cancel", command=cancel)
+        cancel_button.pack(side=tk.LEFT, padx=5)
+
+        frame.place(relx=1.0, rely=1.0, anchor="se", x=-10, y=-45)
+        self.import_progress_frame = frame
+        self.log_message(f"Importing {file_name}...")
+
+    def update_import_progress(self, fraction):
+        if self.import_progress_frame is not None:
+            self.import_progress_bar["value"] = fraction
+
+    def hide_import_progress(self):
+        if self.import_progress_frame is not None:
+            self.import_progress_frame.destroy()
+            self.import_progress_frame = None
+
     def switch_clipping_algorithm(self):
         self._app.switch_clipping_algorithm()
         self.log_message("Clipping algorithm switched.")
@@ -270,35 +308,29 @@ class UserInterface(tk.Tk):
     def move_up(self):
         step = 100
         self.viewport.translate_window(0, step)
-        self.viewport.update()
         self.log_message(f"Moved up by {step} pixels")
     
     def move_down(self):
         step = 100
         self.viewport.translate_window(0, -step)
-        self.viewport.update()
         self.log_message(f"Moved down by {step} pixels")
     
     def move_left(self):
         step = 100
         self.viewport.translate_window(-step, 0)
-        self.viewport.update()
         self.log_message(f"Moved left by {step} pixels")
     
     def move_right(self):
         step = 100
         self.viewport.translate_window(step, 0)
-        self.viewport.update()
         self.log_message(f"Moved right by {step} pixels")
 
     def move_in(self):
         self.viewport.translate_window(0, 0, 100)
-        self.viewport.update()
         self.log_message("Moved in by 20 units")
 
     def move_out(self):
         self.viewport.translate_window(0, 0, -100)
-        self.viewport.update()
         self.log_message("Moved out by 20 units")
 
     def debug(self):
@@ -422,13 +454,11 @@ class UserInterface(tk.Tk):
     def zoom_in(self):
         factor = 0.85
         self.viewport.zoom(factor)
-        self.viewport.update()
         self.log_message("Zoomed in (factor: 0.85)")
     
     def zoom_out(self):
         factor = 1.15
         self.viewport.zoom(factor)
-        self.viewport.update()
         self.log_message("Zoomed out (factor: 1.15)")
     
     def rotate_window(self):
@@ -480,32 +510,26 @@ class UserInterface(tk.Tk):
     def yaw_window_positive(self):
         self.viewport.rotate_window(angle_y=10)
         self.log_message("Yawed window 10 degrees")
-        self.viewport.update()
 
     def pitch_window_negative(self):
         self.viewport.rotate_window(angle_x=10)
         self.log_message("Pitched window 10 degrees")
-        self.viewport.update()
 
     def roll_window_negative(self):
         self.viewport.rotate_window(angle_z=10)
         self.log_message("Rolled window 10 degrees")
-        self.viewport.update()
 
     def yaw_window_negative(self):
         self.viewport.rotate_window(angle_y=-10)
         self.log_message("Yawed window -10 degrees")
-        self.viewport.update()
 
     def pitch_window_positive(self):
         self.viewport.rotate_window(angle_x=-10)
         self.log_message("Pitched window -10 degrees")
-        self.viewport.update()
 
     def roll_window_positive(self):
         self.viewport.rotate_window(angle_z=-10)
         self.log_message("Rolled window -10 degrees")
-        self.viewport.update()
 
     def switch_lens_perspective(self):
         self.viewport.switch_lens_perspective()
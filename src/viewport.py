@@ -4,38 +4,84 @@ import constants as c
 import numpy as np
 from graphical_objects.ponto3d import Ponto3D
 from render import Renderer
+from camera import Camera
+from canvas_item_manager import CanvasItemManager
+from framebuffer import Framebuffer, TkFramebufferPresenter
 from typing import cast
 
-class Viewport(Canvas):
-    def __init__(self, app, master=None, **kwargs):
-        super().__init__(master, **kwargs)
-        self.display_file = DisplayFile()
-
-        from graphical_system import GraphicalSystem
-        self._app = cast(GraphicalSystem, app)
+class ViewportBase:
+    """
+    Pipeline de visualização (câmera, normalização, clipping e desenho) independente do
+    backend. O desenho é feito através de `self.items`, que pode ser o pool de itens do
+    Canvas ou um framebuffer NumPy.
+    """
 
-        # coordenadas da janela
-        self.window_bounds = c.WINDOW_BOUNDS
-        self.vup = c.VIEW_UP_VECTOR
-        self.vrp = c.VIEW_REFERENCE_POINT
-        self.vpn = c.VIEW_PLANE_NORMAL
+    def _setup_view(self, app, width, height):
+        self.display_file = DisplayFile()
+        self._app = app
+
+        # estado da câmera (coordenadas da janela, vetores de visão, COP...)
+        self.camera = Camera(
+            cop=c.CENTER_OF_PROJECTION,
+            vpn=c.VIEW_PLANE_NORMAL,
+            vup=c.VIEW_UP_VECTOR,
+            vrp=c.VIEW_REFERENCE_POINT,
+            focal_distance=c.DEFAULT_FOCAL_DISTANCE,
+            window_bounds=c.WINDOW_BOUNDS,
+            projection=c.PERSPECTIVE_PROJECTION
+        )
         self.margin = 0.05  # margem da janela de clipping
 
         self.window_angle = 0
 
         self.renderer = Renderer(self, app)
 
+        # dimensão da viewport em cache, atualizada pelo evento <Configure> em vez de
+        # consultar o Tk a cada vértice
+        self.viewport_width = width
+        self.viewport_height = height
+
+    # os atributos de visão delegam para a câmera, que versiona cada alteração
+    @property
+    def window_bounds(self):
+        return self.camera.window_bounds
+
+    @window_bounds.setter
+    def window_bounds(self, bounds):
+        self.camera.window_bounds = bounds
+
+    @property
+    def vup(self):
+        return self.camera.vup
+
+    @vup.setter
+    def vup(self, vup):
+        self.camera.vup = vup
+
+    @property
+    def vpn(self):
+        return self.camera.vpn
+
+    @vpn.setter
+    def vpn(self, vpn):
+        self.camera.vpn = vpn
+
+    @property
+    def vrp(self):
+        return self.camera.vrp
+
+    @vrp.setter
+    def vrp(self, vrp):
+        self.camera.vrp = vrp
+
     def draw(self):
+        self.items.begin_frame()
         for obj in self.display_file.get_objects():
             obj.draw(self)
         self.draw_clipping_window()
-        self.display_file.notify()
+        self.items.end_frame()
     
     def window_to_viewport(self, x, y):
-        
-        # dimensão da viewport - atualmente o mesmo tamanho do canvas
-        self.viewport_width = self.winfo_width()
-        self.viewport_height = self.winfo_height()
 
         # utilizando scn
         window_x_min, window_y_min = (0, 0)
@@ -45,6 +91,24 @@ class Viewport(Canvas):
         viewport_y = (1 - (y - window_y_min) / (window_y_max - window_y_min)) * self.viewport_height
 
         return viewport_x, viewport_y
+
+    def window_to_viewport_array(self, points):
+        """
+        Versão vetorizada de window_to_viewport.
+
+        Args:
+            points: array (..., 2) de coordenadas normalizadas.
+
+        Returns:
+            Array de mesmo formato com as coordenadas de viewport.
+        """
+        points = np.asarray(points, dtype=float)
+
+        viewport_points = np.empty_like(points)
+        viewport_points[..., 0] = points[..., 0] * self.viewport_width
+        viewport_points[..., 1] = (1 - points[..., 1]) * self.viewport_height
+
+        return viewport_points
     
     # def translate_window(self, dwx, dwy, dwz=0):
 
@@ -102,27 +166,30 @@ class Viewport(Canvas):
             elif axis == 'z':
                 return np.array([[c, -s, 0], [s, c, 0], [0, 0, 1]])
 
+        vpn = self.vpn
+        vup = self.vup
+
         # Rotação em torno do eixo X
         if angle_x != 0:
             rot_x = rotation_matrix('x', angle_x)
-            self.vpn = np.dot(rot_x, self.vpn)
-            self.vup = np.dot(rot_x, self.vup)
+            vpn = np.dot(rot_x, vpn)
+            vup = np.dot(rot_x, vup)
 
         # Rotação em torno do eixo Y
         if angle_y != 0:
             rot_y = rotation_matrix('y', angle_y)
-            self.vpn = np.dot(rot_y, self.vpn)
-            self.vup = np.dot(rot_y, self.vup)
+            vpn = np.dot(rot_y, vpn)
+            vup = np.dot(rot_y, vup)
 
         # Rotação em torno do eixo Z
         if angle_z != 0:
             rot_z = rotation_matrix('z', angle_z)
-            self.vpn = np.dot(rot_z, self.vpn)
-            self.vup = np.dot(rot_z, self.vup)
+            vpn = np.dot(rot_z, vpn)
+            vup = np.dot(rot_z, vup)
 
-        # Normaliza os vetores
-        self.vpn = self.vpn / np.linalg.norm(self.vpn)
-        self.vup = self.vup / np.linalg.norm(self.vup)  
+        # Normaliza os vetores e atualiza a câmera de uma só vez
+        self.vpn = vpn / np.linalg.norm(vpn)
+        self.vup = vup / np.linalg.norm(vup)
 
         self.update()
 
@@ -132,41 +199,39 @@ class Viewport(Canvas):
 
     def zoom(self, factor):
 
-        self.window_bounds[0] = (self.window_bounds[0][0] * factor, self.window_bounds[0][1] * factor)
-        self.window_bounds[1] = (self.window_bounds[1][0] * factor, self.window_bounds[1][1] * factor)
+        (x_min, y_min), (x_max, y_max) = self.window_bounds
+        self.window_bounds = [(x_min * factor, y_min * factor), (x_max * factor, y_max * factor)]
 
         self.update()
 
-    def clear(self):
-        self.delete("all")
-
-
-    def draw_y_direction(self, length=50, color="red"):
-
-        viewport_width = self.winfo_width()
-        viewport_height = self.winfo_height()
-        cx = viewport_width / 2
-        cy = viewport_height / 2
-
-        vx, vy = self.vup
-        end_x = cx + vx * length
-        end_y = cy - vy * length
-
-        self.create_line(cx, cy, end_x, end_y, fill=color, width=2, arrow="last")
-
     def draw_clipping_window(self):
         # Define os limites da janela de clipping
         x_min, y_min = self.window_to_viewport(-1 + self.margin, -1 + self.margin)
         x_max, y_max = self.window_to_viewport(1 - self.margin, 1 - self.margin)
 
         # Desenha um retângulo representando a área visível
-        self.create_rectangle(
-            x_min, y_min, x_max, y_max,
+        self.items.rectangle(
+            self,
+            (x_min, y_min, x_max, y_max),
             outline="red", width=2, dash=(5, 5)  # Linha tracejada para indicar os limites
         )
     
+    def pixel_size(self):
+        """Unidades de mundo por pixel da viewport (a maior entre os eixos X e Y)."""
+        (x_min, y_min), (x_max, y_max) = self.window_bounds[0][:2], self.window_bounds[1][:2]
+        return max((x_max - x_min) / self.viewport_width, (y_max - y_min) / self.viewport_height)
+
     def update_specific_scn(self, obj):
 
+        # curvas adaptativas são re-tesseladas quando a escala da window muda
+        if obj.get_type() == "Curve":
+            obj.set_pixel_size(self.pixel_size())
+
+        # reaproveita as coordenadas normalizadas se nem a câmera nem o objeto mudaram
+        projection_key = (self.camera.version, obj.get_geometry_version())
+        if obj.get_projection_key() == projection_key:
+            return
+
         if obj.get_type() == "3DObject" or obj.get_type() == "3DPoint":
             
             #print("Objeto 3D: ", obj)
@@ -176,12 +241,14 @@ class Viewport(Canvas):
 
             # objetos 2d não precisam de rotação por eixos diferentes do Z
 
-            vertices = obj.get_vertices()
+            vertices = obj.get_render_vertices()
 
             aligned = self.align_z_axis(vertices)
 
             obj.set_scn_vertices(self.normalize(aligned))
 
+        obj.set_projection_key(projection_key)
+
     def align_z_axis(self, vertices):
             
             x_min, y_min = self.window_bounds[0]
@@ -229,10 +296,107 @@ class Viewport(Canvas):
         for obj in self.display_file.get_objects():
             self.update_specific_scn(obj)
 
-    def update(self):
+    def clip_objects(self):
+        self._app.clip_objects()
+
+    def render_frame(self):
         self.renderer.recompute()
         self.update_all_scn()
-        self._app.clip_objects()
-        self.clear()
+        self.clip_objects()
         self.draw()
-        self.update_idletasks()
+
+    def update(self):
+        self.render_frame()
+
+
+class Viewport(ViewportBase, Canvas):
+    def __init__(self, app, master=None, backend=c.RENDER_BACKEND, **kwargs):
+        Canvas.__init__(self, master, **kwargs)
+
+        from graphical_system import GraphicalSystem
+        app = cast(GraphicalSystem, app)
+
+        self._setup_view(app, kwargs.get("width", c.VIEWPORT_WIDTH), kwargs.get("height", c.VIEWPORT_HEIGHT))
+
+        if backend == c.RENDER_BACKEND_FRAMEBUFFER:
+            # um único PhotoImage com a cena rasterizada em NumPy
+            self.items = TkFramebufferPresenter(
+                self, self.viewport_width, self.viewport_height, kwargs.get("bg", c.VIEWPORT_BG_COLOR)
+            )
+        elif backend == c.RENDER_BACKEND_CANVAS:
+            # itens do canvas reaproveitados entre frames
+            self.items = CanvasItemManager(self)
+        else:
+            raise ValueError(f"backend de renderização desconhecido: {backend}")
+
+        self._redraw_pending = False
+
+        self.bind("<Configure>", self._on_configure)
+
+    def _on_configure(self, event):
+        if (event.width, event.height) == (self.viewport_width, self.viewport_height):
+            return
+
+        self.viewport_width = event.width
+        self.viewport_height = event.height
+
+        # só o framebuffer tem tamanho próprio; os itens do canvas são reposicionados no próximo frame
+        if isinstance(self.items, Framebuffer):
+            self.items.resize(event.width, event.height)
+
+        # as coordenadas de viewport dependem do tamanho do canvas
+        self.update()
+
+    def clear(self):
+        self.delete("all")
+        self.items.clear()
+
+    def draw_y_direction(self, length=50, color="red"):
+
+        cx = self.viewport_width / 2
+        cy = self.viewport_height / 2
+
+        vx, vy = self.vup
+        end_x = cx + vx * length
+        end_y = cy - vy * length
+
+        self.create_line(cx, cy, end_x, end_y, fill=color, width=2, arrow="last")
+
+    def update(self):
+        # todas as requisições de redesenho feitas até o Tk ficar ocioso viram um único frame
+        self.request_redraw()
+
+    def request_redraw(self):
+        if self._redraw_pending:
+            return
+        self._redraw_pending = True
+        self.after_idle(self._run_scheduled_frame)
+
+    def _run_scheduled_frame(self):
+        self._redraw_pending = False
+        self.render_frame()
+
+
+class HeadlessViewport(ViewportBase):
+    """
+    Viewport sem Tk: renderiza a display file em um framebuffer NumPy, útil para
+    jobs em lote, benchmarks e CI.
+    """
+
+    def __init__(self, width=c.VIEWPORT_WIDTH, height=c.VIEWPORT_HEIGHT, background=c.VIEWPORT_BG_COLOR):
+        self._setup_view(None, width, height)
+        self.items = Framebuffer(width, height, background)
+
+        from clipper import Clipper
+        self._clipper = Clipper()
+
+    def clip_objects(self):
+        self._clipper.clip(self.display_file.get_objects(), self)
+
+    def clear(self):
+        self.items.clear()
+
+    def save_png(self, file_path):
+        self.render_frame()
+        self.items.save(file_path)
+